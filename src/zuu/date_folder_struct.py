@@ -25,7 +25,10 @@ Example Usage:
 
 import datetime
 import os
+import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from typing import List, Dict
 from .match_string import (
     is_year, is_year_month, is_year_month_day, is_time, 
@@ -33,6 +36,63 @@ from .match_string import (
 )
 
 
+_WEEKDAY_NUMBERS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+_MONTH_NUMBERS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6,
+    'jul': 7, 'july': 7, 'aug': 8, 'august': 8, 'sep': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12
+}
+
+_YMD = r'20\d\d-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])'
+_HMS = r'(?:[01]\d|2[0-3])\.[0-5]\d\.[0-5]\d'
+_YM = r'\d{4}-(?:0[1-9]|1[0-2])'
+
+# Canonically written folder names. Date ranges have a fixed length per
+# format, so the length picks the single pattern worth trying; every_* names
+# share one pattern. Names rejected here (surrounding whitespace, unpadded
+# months, non-ASCII digits, ...) still go through the individual checks in
+# _basename_format_type, which stay authoritative.
+_CANONICAL_BY_LENGTH = {
+    9: ('yy', re.compile(r'\d{4}_\d{4}', re.ASCII)),
+    15: ('ym', re.compile(rf'{_YM}_{_YM}', re.ASCII)),
+    21: ('ymd', re.compile(rf'{_YMD}_{_YMD}', re.ASCII)),
+    39: ('dt', re.compile(rf'{_YMD}-{_HMS}_{_YMD}-{_HMS}', re.ASCII)),
+}
+
+_EVERY_RE = re.compile(
+    r'every_(?:(?P<wk>(?i:monday|tuesday|wednesday|thursday|friday|saturday|sunday))'
+    r'|(?P<md>(?i:jan|january|feb|february|mar|march|apr|april|may|jun|june'
+    r'|jul|july|aug|august|sep|september|oct|october|nov|november|dec|december)'
+    r'_(?:0[1-9]|[12]\d|3[01])))',
+    re.ASCII,
+)
+
+_FORMAT_GROUPS = {
+    'yy': "YEAR_YEAR",
+    'ym': "YEAR-MM_YEAR-MM",
+    'ymd': "YEAR-MM-DD_YEAR-MM-DD",
+    'dt': "YEAR-MM-DD-HH.MM.SS_YEAR-MM-DD-HH.MM.SS",
+    'wk': "WEEKDAY_PATTERN",
+    'md': "MONTHLY_DATE_PATTERN",
+}
+
+
+def _canonical_group(name: str) -> str | None:
+    """Return the _FORMAT_GROUPS key of a canonically written folder name, or None."""
+    if name.startswith('every_'):
+        match = _EVERY_RE.fullmatch(name)
+        return match.lastgroup if match else None
+    candidate = _CANONICAL_BY_LENGTH.get(len(name))
+    if candidate is not None and candidate[1].fullmatch(name):
+        return candidate[0]
+    return None
+
+
 def get_datefolder_format_type(path: str) -> str | None:
     """
     Determines the date format type of a folder based on its name.
@@ -62,8 +122,19 @@ def get_datefolder_format_type(path: str) -> str | None:
         >>> get_datefolder_format_type("invalid_format")
         None
     """
-    basename = os.path.basename(path)
-    
+    return _basename_format_type(os.path.basename(path))
+
+
+@lru_cache(maxsize=4096)
+def _basename_format_type(basename: str) -> str | None:
+    """Detect the format type of a bare folder name (cached, see get_datefolder_format_type)."""
+    group = _canonical_group(basename)
+    if group:
+        return _FORMAT_GROUPS[group]
+    if '_' not in basename:
+        # Every format, every_* patterns included, needs an underscore
+        return None
+
     # Check for special date formats first (these can have multiple underscores)
     if is_weekday_pattern(basename):
         return "WEEKDAY_PATTERN"
@@ -100,6 +171,44 @@ def get_datefolder_format_type(path: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=4096)
+def _month_end(year: int, month: int) -> datetime.datetime:
+    """
+    Return the end datetime of a YEAR-MM folder month.
+    
+    The microsecond before the next month starts, except that December ends at
+    23:59:59 like YEAR_YEAR folders do. Cached, as datetimes are immutable.
+    """
+    if month == 12:
+        return datetime.datetime(year, 12, 31, 23, 59, 59)
+    return datetime.datetime(year, month + 1, 1, 0, 0, 0) - datetime.timedelta(microseconds=1)
+
+
+def _parse_canonical_range(group: str, name: str) -> tuple[datetime.datetime, datetime.datetime] | None:
+    """Parse a canonically written name (see _canonical_group) by slicing its fixed-width fields."""
+    try:
+        if group == 'yy':
+            return (datetime.datetime(int(name[0:4]), 1, 1, 0, 0, 0),
+                    datetime.datetime(int(name[5:9]), 12, 31, 23, 59, 59))
+        elif group == 'ym':
+            return (datetime.datetime(int(name[0:4]), int(name[5:7]), 1, 0, 0, 0),
+                    _month_end(int(name[8:12]), int(name[13:15])))
+        elif group == 'ymd':
+            return (datetime.datetime(int(name[0:4]), int(name[5:7]), int(name[8:10]), 0, 0, 0),
+                    datetime.datetime(int(name[11:15]), int(name[16:18]), int(name[19:21]), 23, 59, 59))
+        elif group == 'dt':
+            return (datetime.datetime(int(name[0:4]), int(name[5:7]), int(name[8:10]),
+                                      int(name[11:13]), int(name[14:16]), int(name[17:19])),
+                    datetime.datetime(int(name[20:24]), int(name[25:27]), int(name[28:30]),
+                                      int(name[31:33]), int(name[34:36]), int(name[37:39])))
+    except ValueError:
+        # e.g. a day that does not exist in its month
+        return None
+    # Recurring patterns have no fixed datetime range
+    return None
+
+
+@lru_cache(maxsize=4096)
 def parse_date_range(folder_name: str) -> tuple[datetime.datetime, datetime.datetime] | None:
     """
     Parse a date range from a folder name string.
@@ -108,6 +217,9 @@ def parse_date_range(folder_name: str) -> tuple[datetime.datetime, datetime.date
     The end datetime is automatically set to the maximum possible time for the
     given granularity (e.g., year ends at 23:59:59 on Dec 31).
     
+    Results are cached per folder name; the returned tuple and datetimes are
+    immutable, so cached values are safe to share.
+    
     Args:
         folder_name (str): The folder name to parse
         
@@ -123,6 +235,11 @@ def parse_date_range(folder_name: str) -> tuple[datetime.datetime, datetime.date
         >>> parse_date_range("invalid")
         None
     """
+    # Canonically written names have fixed-width fields
+    group = _canonical_group(folder_name)
+    if group:
+        return _parse_canonical_range(group, folder_name)
+    
     format_type = get_datefolder_format_type(folder_name)
     if not format_type:
         return None
@@ -151,12 +268,7 @@ def parse_date_range(folder_name: str) -> tuple[datetime.datetime, datetime.date
             year1, month1 = split1.split('-')
             year2, month2 = split2.split('-')
             start_datetime = datetime.datetime(int(year1), int(month1), 1, 0, 0, 0)
-            # Get last day of the month
-            if int(month2) == 12:
-                end_datetime = datetime.datetime(int(year2), 12, 31, 23, 59, 59)
-            else:
-                next_month = datetime.datetime(int(year2), int(month2) + 1, 1, 0, 0, 0)
-                end_datetime = next_month - datetime.timedelta(microseconds=1)
+            end_datetime = _month_end(int(year2), int(month2))
         elif format_type == "YEAR-MM-DD_YEAR-MM-DD":
             year1, month1, day1 = split1.split('-')
             year2, month2, day2 = split2.split('-')
@@ -183,6 +295,155 @@ def parse_date_range(folder_name: str) -> tuple[datetime.datetime, datetime.date
         return None
 
 
+class _IntervalNode:
+    """
+    Node of the augmented interval tree used for overlap validation.
+
+    Nodes are ordered by ``key``, which defaults to the start datetime and may
+    carry tie-breakers after it; ``max_end`` is the largest end datetime in the
+    subtree and ``size`` its node count (used for rebalancing).
+    """
+    __slots__ = ('start', 'end', 'name', 'key', 'max_end', 'size', 'left', 'right')
+
+    def __init__(self, start: datetime.datetime, end: datetime.datetime, name: str, key=None):
+        self.start = start
+        self.end = end
+        self.name = name
+        self.key = start if key is None else key
+        self.max_end = end
+        self.size = 1
+        self.left = None
+        self.right = None
+
+
+def _build_interval_tree(ranges: List[tuple]) -> _IntervalNode | None:
+    """Build a balanced interval tree from ``(start, end, name[, key])`` tuples sorted by key."""
+    def build(lo: int, hi: int) -> _IntervalNode | None:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = _IntervalNode(*ranges[mid])
+        node.left = build(lo, mid)
+        node.right = build(mid + 1, hi)
+        for child in (node.left, node.right):
+            if child is not None:
+                node.size += child.size
+                if child.max_end > node.max_end:
+                    node.max_end = child.max_end
+        return node
+
+    return build(0, len(ranges))
+
+
+def _iter_interval_tree(node: _IntervalNode | None):
+    """Yield the nodes of a subtree in start order."""
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def _iter_intersecting(node: _IntervalNode | None, start: datetime.datetime, end: datetime.datetime):
+    """Yield, in start order, the nodes whose range intersects ``[start, end]``."""
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            left = node.left
+            node = left if left is not None and left.max_end >= start else None
+        node = stack.pop()
+        if node.start > end:
+            # Everything further right starts even later
+            break
+        if node.end >= start:
+            yield node
+        right = node.right
+        node = right if right is not None and right.max_end >= start else None
+
+
+def _insert_interval(root: _IntervalNode | None, node: _IntervalNode) -> _IntervalNode:
+    """
+    Insert a node after any existing nodes with the same key and return the new root.
+
+    Keeps the tree balanced scapegoat-style: when the insertion path grows too
+    deep, the first ancestor whose subtree is lopsided is rebuilt.
+    """
+    if root is None:
+        return node
+
+    path = []
+    current = root
+    while current is not None:
+        current.size += 1
+        if node.end > current.max_end:
+            current.max_end = node.end
+        path.append(current)
+        current = current.right if current.key <= node.key else current.left
+
+    parent = path[-1]
+    if parent.key <= node.key:
+        parent.right = node
+    else:
+        parent.left = node
+
+    if len(path) <= 2 * root.size.bit_length():
+        return root
+
+    child = node
+    for depth in range(len(path) - 1, -1, -1):
+        candidate = path[depth]
+        if 3 * child.size > 2 * candidate.size:
+            rebuilt = _build_interval_tree([(n.start, n.end, n.name, n.key) for n in _iter_interval_tree(candidate)])
+            if depth == 0:
+                return rebuilt
+            above = path[depth - 1]
+            if above.left is candidate:
+                above.left = rebuilt
+            else:
+                above.right = rebuilt
+            break
+        child = candidate
+
+    return root
+
+
+def _overlap_error(name1: str, start1: datetime.datetime, end1: datetime.datetime,
+                   name2: str, start2: datetime.datetime, end2: datetime.datetime) -> str | None:
+    """Return the error for two intersecting ranges, or None when one nests inside the other."""
+    if start1 <= start2 and end2 <= end1:
+        # Range 2 is completely inside range 1 (valid nesting)
+        return None
+    if start2 <= start1 and end1 <= end2:
+        # Range 1 is completely inside range 2 (valid nesting)
+        return None
+    # Invalid overlap (partial overlap)
+    return f"Invalid overlap between '{name1}' ({start1} to {end1}) and '{name2}' ({start2} to {end2})"
+
+
+def _ranges_laminar(ranges: List[tuple]) -> bool:
+    """
+    Return True if start-sorted ``(start, end, ...)`` ranges are pairwise nested or disjoint.
+    
+    A single pass keeping the ends of the still-open enclosing ranges on a stack.
+    A False result is conservative (e.g. for inverted ranges): it only means the
+    pairwise check has to decide.
+    """
+    open_ends = []
+    for start, end, *_ in ranges:
+        if start > end:
+            return False
+        while open_ends and open_ends[-1] < start:
+            open_ends.pop()
+        if open_ends and end > open_ends[-1]:
+            return False
+        open_ends.append(end)
+    return True
+
+
 def validate_folder_names(folder_names: List[str]) -> List[str]:
     """
     Validate a list of folder names to ensure no invalid date range overlaps.
@@ -222,30 +483,58 @@ def validate_folder_names(folder_names: List[str]) -> List[str]:
         if date_range is None:
             errors.append(f"Invalid folder name format: {folder_name}")
             continue
-        ranges.append((folder_name, date_range[0], date_range[1]))
+        ranges.append((date_range[0], date_range[1], folder_name))
     
     # Sort ranges by start time
-    ranges.sort(key=lambda x: x[1])
-    
-    # Check for invalid overlaps
-    for i, (name1, start1, end1) in enumerate(ranges):
-        for j, (name2, start2, end2) in enumerate(ranges[i+1:], i+1):
-            # Check if ranges overlap
-            if start2 <= end1:
-                # Check if it's a valid nested relationship or invalid overlap
-                if start1 <= start2 and end2 <= end1:
-                    # Range 2 is completely inside range 1 (valid nesting)
-                    continue
-                elif start2 <= start1 and end1 <= end2:
-                    # Range 1 is completely inside range 2 (valid nesting)
-                    continue
-                else:
-                    # Invalid overlap (partial overlap)
-                    errors.append(f"Invalid overlap between '{name1}' ({start1} to {end1}) and '{name2}' ({start2} to {end2})")
+    ranges.sort(key=lambda x: x[0])
+    
+    # Valid structures need no pairwise work at all
+    if _ranges_laminar(ranges):
+        return errors
+    
+    # Check each range against the later ranges it intersects
+    root = _build_interval_tree(ranges)
+    for node in _iter_interval_tree(root):
+        if node.start > node.end:
+            # An inverted range cannot reach any later start
+            continue
+        later = False
+        for other in _iter_intersecting(root, node.start, node.end):
+            if other is node:
+                later = True
+            elif later:
+                error = _overlap_error(node.name, node.start, node.end, other.name, other.start, other.end)
+                if error:
+                    errors.append(error)
     
     return errors
 
 
+# Folder name builders for _generate_folder_name, keyed by folder_type
+_FOLDER_NAME_FORMATTERS = {
+    "YEAR_YEAR": lambda s, e: f"{s.year}_{e.year}",
+    "YEAR-MM_YEAR-MM": lambda s, e: f"{s.year}-{s.month:02d}_{e.year}-{e.month:02d}",
+    "YEAR-MM-DD_YEAR-MM-DD": lambda s, e: (
+        f"{s.year}-{s.month:02d}-{s.day:02d}_{e.year}-{e.month:02d}-{e.day:02d}"
+    ),
+    "YEAR-MM-DD-HH.MM.SS_YEAR-MM-DD-HH.MM.SS": lambda s, e: (
+        f"{s.year}-{s.month:02d}-{s.day:02d}-{s.hour:02d}.{s.minute:02d}.{s.second:02d}"
+        f"_{e.year}-{e.month:02d}-{e.day:02d}-{e.hour:02d}.{e.minute:02d}.{e.second:02d}"
+    ),
+}
+
+_ONE_WEEK = datetime.timedelta(weeks=1)
+
+
+def _weekly(start: datetime.datetime, count: int):
+    """Yield count datetimes one week apart, starting at start, by stepping a single timedelta."""
+    current = start
+    for i in range(count):
+        if i:
+            current += _ONE_WEEK
+        yield current
+
+
 class AbstractDateFolder(ABC):
     """
     Abstract base class for date folder operations.
@@ -254,12 +543,17 @@ class AbstractDateFolder(ABC):
     sorting, and date resolution capabilities. Concrete implementations handle the
     actual I/O operations while sharing common business logic.
     
-    The class maintains an internal list of folders sorted by start datetime and
+    The class keeps folder metadata as parallel lists sorted by start datetime and
     provides methods for adding new folders, resolving current/future folders,
     and validating date range conflicts.
     
     Attributes:
-        _folders (List[Dict[str, any]]): Internal list of folder metadata
+        _names (List[str]): Folder names
+        _paths (List[str]): Folder paths
+        _starts (List[datetime.datetime]): Start datetimes, sorted ascending
+        _ends (List[datetime.datetime]): End datetimes
+        _format_types (List[str]): Format type of each folder
+        _max_ends (List[datetime.datetime]): Running maximum of _ends, for bisecting
     
     Abstract Methods:
         _create_folder: Create the actual folder structure
@@ -272,7 +566,16 @@ class AbstractDateFolder(ABC):
     """
     
     def __init__(self):
-        self._folders: List[Dict[str, any]] = []
+        self._names: List[str] = []
+        self._paths: List[str] = []
+        self._starts: List[datetime.datetime] = []
+        self._ends: List[datetime.datetime] = []
+        self._format_types: List[str] = []
+        self._max_ends: List[datetime.datetime] = []
+        # Folders added by add_every that are not merged into the lists yet
+        self._pending: List[tuple] | None = None
+        # Dicts built by list_folders, dropped whenever the lists change
+        self._folders_cache: List[Dict[str, any]] | None = None
 
     @abstractmethod
     def _create_folder(self, folder_path: str) -> bool:
@@ -327,16 +630,58 @@ class AbstractDateFolder(ABC):
             date_range = parse_date_range(folder_name)
             if date_range:
                 folder_path = os.path.join(base_path, folder_name) if hasattr(self, '_DateFolder__path') else folder_name
-                self._folders.append({
-                    'name': folder_name,
-                    'path': folder_path,
-                    'start_datetime': date_range[0],
-                    'end_datetime': date_range[1],
-                    'format_type': get_datefolder_format_type(folder_name)
-                })
+                self._append_folder(folder_name, folder_path, date_range[0], date_range[1],
+                                    get_datefolder_format_type(folder_name))
         
         # Sort folders by start datetime
-        self._folders.sort(key=lambda x: x['start_datetime'])
+        self._reindex_folders()
+
+    def _append_folder(self, name: str, path: str, start_datetime: datetime.datetime,
+                       end_datetime: datetime.datetime, format_type: str):
+        """Append folder metadata without sorting; call _reindex_folders afterwards."""
+        self._names.append(name)
+        self._paths.append(path)
+        self._starts.append(start_datetime)
+        self._ends.append(end_datetime)
+        self._format_types.append(format_type)
+
+    def _reindex_folders(self):
+        """Sort the folders by start datetime and rebuild the running maximum of ends."""
+        order = sorted(range(len(self._starts)), key=self._starts.__getitem__)
+        self._names = [self._names[i] for i in order]
+        self._paths = [self._paths[i] for i in order]
+        self._starts = [self._starts[i] for i in order]
+        self._ends = [self._ends[i] for i in order]
+        self._format_types = [self._format_types[i] for i in order]
+        self._max_ends = []
+        self._refresh_max_ends(0)
+        self._folders_cache = None
+
+    def _refresh_max_ends(self, index: int):
+        """Recompute the running maximum of end datetimes from the given index on."""
+        del self._max_ends[index:]
+        running = self._max_ends[-1] if self._max_ends else None
+        for end in self._ends[index:]:
+            if running is None or end > running:
+                running = end
+            self._max_ends.append(running)
+
+    def _find_folder(self, dt: datetime.datetime) -> str | None:
+        """
+        Return the path of the first folder (in start order) containing dt.
+        
+        Shared by current(), future() and get_folder_for_datetime(). With nested
+        folders this is the earliest-starting, i.e. outermost, one.
+        
+        Folders starting after dt are cut off by bisecting the start datetimes.
+        Among the rest, the first one reaching dt is where the running maximum of
+        end datetimes first reaches dt, which is found by bisecting it too.
+        """
+        count = bisect_right(self._starts, dt)
+        index = bisect_left(self._max_ends, dt, 0, count)
+        if index < count:
+            return self._paths[index]
+        return None
 
     def current(self, reference_datetime: datetime.datetime = None) -> str | None:
         """
@@ -362,11 +707,7 @@ class AbstractDateFolder(ABC):
         if reference_datetime is None:
             reference_datetime = datetime.datetime.now()
             
-        for folder in self._folders:
-            if folder['start_datetime'] <= reference_datetime <= folder['end_datetime']:
-                return folder['path']
-        
-        return None
+        return self._find_folder(reference_datetime)
 
     def future(self, dt: datetime.datetime) -> str | None:
         """
@@ -386,11 +727,7 @@ class AbstractDateFolder(ABC):
             >>> folder.future(datetime.datetime(2023, 6, 15))
             '/path/to/2023_2023'
         """
-        for folder in self._folders:
-            if folder['start_datetime'] <= dt <= folder['end_datetime']:
-                return folder['path']
-        
-        return None
+        return self._find_folder(dt)
 
     def add(self, folder_type: str, start_datetime: datetime.datetime, end_datetime: datetime.datetime = None, base_path: str = None, skip_validation: bool = False) -> str:
         """
@@ -424,8 +761,7 @@ class AbstractDateFolder(ABC):
         
         # Validate no conflicts with existing folders (unless skipping validation)
         if not skip_validation:
-            all_folder_names = [f['name'] for f in self._folders] + [folder_name]
-            validation_errors = validate_folder_names(all_folder_names)
+            validation_errors = self._validate_new_folder(folder_name)
             if validation_errors:
                 raise ValueError(f"Validation failed: {'; '.join(validation_errors)}")
         
@@ -433,30 +769,56 @@ class AbstractDateFolder(ABC):
         if not self._create_folder(folder_path):
             raise ValueError(f"Failed to create folder: {folder_path}")
         
-        # Add to internal list
-        self._folders.append({
-            'name': folder_name,
-            'path': folder_path,
-            'start_datetime': start_datetime,
-            'end_datetime': end_datetime,
-            'format_type': folder_type
-        })
-        
-        # Re-sort folders by start datetime
-        self._folders.sort(key=lambda x: x['start_datetime'])
+        if self._pending is not None:
+            # Batched by add_every, see _flush_pending
+            self._pending.append((folder_name, folder_path, start_datetime, end_datetime, folder_type))
+            return folder_path
+        
+        # Insert after any folders with the same start to keep the lists sorted
+        index = bisect_right(self._starts, start_datetime)
+        self._names.insert(index, folder_name)
+        self._paths.insert(index, folder_path)
+        self._starts.insert(index, start_datetime)
+        self._ends.insert(index, end_datetime)
+        self._format_types.insert(index, folder_type)
+        self._refresh_max_ends(index)
+        self._folders_cache = None
+        self._folder_added(folder_name, start_datetime)
         
         return folder_path
 
+    def _flush_pending(self):
+        """
+        Merge the folders batched by add_every into the sorted lists.
+        
+        Appending them and re-sorting once (stable, so they land after existing
+        folders with the same start, in creation order) gives the same order as
+        inserting them one by one.
+        """
+        pending, self._pending = self._pending, None
+        if not pending:
+            return
+        for entry in pending:
+            self._append_folder(*entry)
+        self._reindex_folders()
+        for folder_name, _, start_datetime, _, _ in pending:
+            self._folder_added(folder_name, start_datetime)
+
+    def _validate_new_folder(self, folder_name: str) -> List[str]:
+        """Validate a new folder name against all existing folders."""
+        all_folder_names = self._names + [folder_name]
+        return validate_folder_names(all_folder_names)
+
+    def _folder_added(self, folder_name: str, start_datetime: datetime.datetime):
+        """Hook called after a folder has been added to the internal lists."""
+        pass
+
     def _calculate_default_end_datetime(self, folder_type: str, start_datetime: datetime.datetime) -> datetime.datetime:
         """Calculate default end datetime based on folder type."""
         if folder_type == "YEAR_YEAR":
             return datetime.datetime(start_datetime.year, 12, 31, 23, 59, 59)
         elif folder_type == "YEAR-MM_YEAR-MM":
-            if start_datetime.month == 12:
-                return datetime.datetime(start_datetime.year, 12, 31, 23, 59, 59)
-            else:
-                next_month = datetime.datetime(start_datetime.year, start_datetime.month + 1, 1, 0, 0, 0)
-                return next_month - datetime.timedelta(microseconds=1)
+            return _month_end(start_datetime.year, start_datetime.month)
         elif folder_type == "YEAR-MM-DD_YEAR-MM-DD":
             return datetime.datetime(start_datetime.year, start_datetime.month, start_datetime.day, 23, 59, 59)
         elif folder_type == "YEAR-MM-DD-HH.MM.SS_YEAR-MM-DD-HH.MM.SS":
@@ -466,26 +828,31 @@ class AbstractDateFolder(ABC):
 
     def _generate_folder_name(self, folder_type: str, start_datetime: datetime.datetime, end_datetime: datetime.datetime) -> str:
         """Generate folder name based on type and datetime range."""
-        if folder_type == "YEAR_YEAR":
-            return f"{start_datetime.year}_{end_datetime.year}"
-        elif folder_type == "YEAR-MM_YEAR-MM":
-            return f"{start_datetime.year}-{start_datetime.month:02d}_{end_datetime.year}-{end_datetime.month:02d}"
-        elif folder_type == "YEAR-MM-DD_YEAR-MM-DD":
-            return f"{start_datetime.year}-{start_datetime.month:02d}-{start_datetime.day:02d}_{end_datetime.year}-{end_datetime.month:02d}-{end_datetime.day:02d}"
-        elif folder_type == "YEAR-MM-DD-HH.MM.SS_YEAR-MM-DD-HH.MM.SS":
-            start_str = f"{start_datetime.year}-{start_datetime.month:02d}-{start_datetime.day:02d}-{start_datetime.hour:02d}.{start_datetime.minute:02d}.{start_datetime.second:02d}"
-            end_str = f"{end_datetime.year}-{end_datetime.month:02d}-{end_datetime.day:02d}-{end_datetime.hour:02d}.{end_datetime.minute:02d}.{end_datetime.second:02d}"
-            return f"{start_str}_{end_str}"
-        else:
+        formatter = _FOLDER_NAME_FORMATTERS.get(folder_type)
+        if formatter is None:
             raise ValueError(f"Unknown folder_type: {folder_type}")
+        return formatter(start_datetime, end_datetime)
 
     def list_folders(self) -> List[Dict[str, any]]:
         """Return list of all date folders with their metadata."""
-        return self._folders.copy()
+        if self._folders_cache is None:
+            self._folders_cache = [
+                {
+                    'name': name,
+                    'path': path,
+                    'start_datetime': start_datetime,
+                    'end_datetime': end_datetime,
+                    'format_type': format_type
+                }
+                for name, path, start_datetime, end_datetime, format_type in zip(
+                    self._names, self._paths, self._starts, self._ends, self._format_types
+                )
+            ]
+        return self._folders_cache.copy()
 
     def get_folder_for_datetime(self, target_datetime: datetime.datetime) -> str | None:
         """Get folder path that contains the target datetime."""
-        return self.future(target_datetime)
+        return self._find_folder(target_datetime)
 
     def add_every(self, pattern: str, start_date: datetime.datetime = None, count: int = None) -> str | List[str]:
         """
@@ -526,34 +893,43 @@ class AbstractDateFolder(ABC):
         from .match_string import is_weekday, is_monthtext_day
         
         created_folders = []
+        lowered = pattern.lower()
         
-        # Handle weekday patterns
-        if is_weekday(pattern.lower()):
-            created_folders = self._add_every_weekday(pattern.lower(), start_date, count)
+        # Folders created below are merged into the sorted lists in one go
+        batching = self._pending is None
+        if batching:
+            self._pending = []
+        try:
+            # Handle weekday patterns
+            if is_weekday(lowered):
+                created_folders = self._add_every_weekday(lowered, start_date, count)
             
-        # Handle monthly date patterns (both "feb_14" and "february_14" formats)
-        elif "_" in pattern and (is_monthtext_day(pattern.lower()) or pattern.lower().startswith("every_")):
-            # Remove "every_" prefix if present
-            clean_pattern = pattern.lower()
-            if clean_pattern.startswith("every_"):
-                clean_pattern = clean_pattern[6:]  # Remove "every_" prefix
+            # Handle monthly date patterns (both "feb_14" and "february_14" formats)
+            elif "_" in pattern and (is_monthtext_day(lowered) or lowered.startswith("every_")):
+                # Remove "every_" prefix if present
+                clean_pattern = lowered
+                if clean_pattern.startswith("every_"):
+                    clean_pattern = clean_pattern[6:]  # Remove "every_" prefix
             
-            # Validate the clean pattern before processing
-            if not is_monthtext_day(clean_pattern):
-                raise ValueError(f"Invalid pattern: {pattern}")
+                # Validate the clean pattern before processing
+                if not is_monthtext_day(clean_pattern):
+                    raise ValueError(f"Invalid pattern: {pattern}")
                 
-            created_folders = self._add_every_monthly_date(clean_pattern, start_date, count)
+                created_folders = self._add_every_monthly_date(clean_pattern, start_date, count)
             
-        # Handle time period patterns
-        elif pattern.lower() in ["week", "month", "quarter", "year"]:
-            created_folders = self._add_every_time_period(pattern.lower(), start_date, count)
+            # Handle time period patterns
+            elif lowered in ["week", "month", "quarter", "year"]:
+                created_folders = self._add_every_time_period(lowered, start_date, count)
             
-        # Handle special patterns
-        elif pattern.lower() in ["weekend", "workweek"]:
-            created_folders = self._add_every_special_pattern(pattern.lower(), start_date, count)
+            # Handle special patterns
+            elif lowered in ["weekend", "workweek"]:
+                created_folders = self._add_every_special_pattern(lowered, start_date, count)
             
-        else:
-            raise ValueError(f"Invalid pattern: {pattern}")
+            else:
+                raise ValueError(f"Invalid pattern: {pattern}")
+        finally:
+            if batching:
+                self._flush_pending()
         
         # Return single string for count=1, list for count>1
         if count == 1 and len(created_folders) == 1:
@@ -562,8 +938,7 @@ class AbstractDateFolder(ABC):
 
     def _add_every_weekday(self, weekday: str, start_date: datetime.datetime, count: int) -> List[str]:
         """Create folders for recurring weekday pattern."""
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        target_weekday = weekdays.index(weekday.lower())
+        target_weekday = _WEEKDAY_NUMBERS[weekday.lower()]
         
         created_folders = []
         current_date = start_date
@@ -575,8 +950,7 @@ class AbstractDateFolder(ABC):
         current_date = current_date + datetime.timedelta(days=days_ahead)
         
         # Create folders for each occurrence
-        for i in range(count):
-            folder_date = current_date + datetime.timedelta(weeks=i)
+        for folder_date in _weekly(current_date, count):
             folder_name = self.add("YEAR-MM-DD_YEAR-MM-DD", folder_date, folder_date, skip_validation=True)
             created_folders.append(folder_name)
             
@@ -591,18 +965,9 @@ class AbstractDateFolder(ABC):
             
         month_name, day_str = parts
         
-        # Map month names to numbers
-        month_map = {
-            'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6,
-            'jul': 7, 'july': 7, 'aug': 8, 'august': 8, 'sep': 9, 'september': 9,
-            'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12
-        }
-        
-        if month_name.lower() not in month_map:
+        target_month = _MONTH_NUMBERS.get(month_name.lower())
+        if target_month is None:
             raise ValueError(f"Invalid month name: {month_name}")
-            
-        target_month = month_map[month_name.lower()]
         
         try:
             target_day = int(day_str)
@@ -640,9 +1005,9 @@ class AbstractDateFolder(ABC):
         created_folders = []
         
         if period == "week":
-            for i in range(count):
-                week_start = start_date + datetime.timedelta(weeks=i)
-                week_end = week_start + datetime.timedelta(days=6, hours=23, minutes=59, seconds=59, microseconds=999999)
+            week_span = datetime.timedelta(days=6, hours=23, minutes=59, seconds=59, microseconds=999999)
+            for week_start in _weekly(start_date, count):
+                week_end = week_start + week_span
                 folder_name = self.add("YEAR-MM-DD_YEAR-MM-DD", week_start, week_end, skip_validation=True)
                 created_folders.append(folder_name)
                 
@@ -719,9 +1084,9 @@ class AbstractDateFolder(ABC):
                 days_ahead += 7
             current_date = current_date + datetime.timedelta(days=days_ahead)
             
-            for i in range(count):
-                weekend_start = current_date + datetime.timedelta(weeks=i)  # Saturday
-                weekend_end = weekend_start + datetime.timedelta(days=1, hours=23, minutes=59, seconds=59)  # Sunday end
+            weekend_span = datetime.timedelta(days=1, hours=23, minutes=59, seconds=59)
+            for weekend_start in _weekly(current_date, count):  # Saturday
+                weekend_end = weekend_start + weekend_span  # Sunday end
                 folder_name = self.add("YEAR-MM-DD_YEAR-MM-DD", weekend_start, weekend_end, skip_validation=True)
                 created_folders.append(folder_name)
                 
@@ -734,9 +1099,9 @@ class AbstractDateFolder(ABC):
                 days_ahead += 7
             current_date = current_date + datetime.timedelta(days=days_ahead)
             
-            for i in range(count):
-                workweek_start = current_date + datetime.timedelta(weeks=i)  # Monday
-                workweek_end = workweek_start + datetime.timedelta(days=4, hours=23, minutes=59, seconds=59)  # Friday end
+            workweek_span = datetime.timedelta(days=4, hours=23, minutes=59, seconds=59)
+            for workweek_start in _weekly(current_date, count):  # Monday
+                workweek_end = workweek_start + workweek_span  # Friday end
                 folder_name = self.add("YEAR-MM-DD_YEAR-MM-DD", workweek_start, workweek_end, skip_validation=True)
                 created_folders.append(folder_name)
                 
@@ -779,21 +1144,82 @@ class InMemoryDateFolder(AbstractDateFolder):
         super().__init__()
         self._existing_folders = set(existing_folders or [])
         self._created_folders = set()
+        # Interval tree over the parsed folder ranges, built on first validation
+        self._tree: _IntervalNode | None = None
+        self._tree_built = False
+        self._tree_clean = False
+        self._tree_seq = 0
         
         # Load existing folders
         if existing_folders:
             for folder_name in existing_folders:
                 date_range = parse_date_range(folder_name)
                 if date_range:
-                    self._folders.append({
-                        'name': folder_name,
-                        'path': folder_name,
-                        'start_datetime': date_range[0],
-                        'end_datetime': date_range[1],
-                        'format_type': get_datefolder_format_type(folder_name)
-                    })
+                    self._append_folder(folder_name, folder_name, date_range[0], date_range[1],
+                                        get_datefolder_format_type(folder_name))
             
-            self._folders.sort(key=lambda x: x['start_datetime'])
+            self._reindex_folders()
+
+    def _build_tree(self):
+        """Build the interval tree from the loaded folders and record whether they conflict."""
+        # Ties on the parsed start keep the stored folder order, as a full
+        # validation would: by stored start datetime, then insertion order
+        ranges = []
+        self._tree_clean = True
+        for seq, (folder_name, start_datetime) in enumerate(zip(self._names, self._starts)):
+            date_range = parse_date_range(folder_name)
+            if date_range is None:
+                self._tree_clean = False
+                continue
+            key = (date_range[0], start_datetime, seq)
+            ranges.append((date_range[0], date_range[1], folder_name, key))
+        ranges.sort(key=lambda x: x[3])
+        self._tree = _build_interval_tree(ranges)
+        self._tree_seq = len(self._names)
+        self._tree_built = True
+        if self._tree_clean and validate_folder_names([r[2] for r in ranges]):
+            self._tree_clean = False
+
+    def _tree_errors(self, folder_name: str, start: datetime.datetime, end: datetime.datetime) -> List[str]:
+        """Return overlap errors between a new range and the ranges already in the tree."""
+        errors = []
+        for other in _iter_intersecting(self._tree, start, end):
+            if other.start <= start:
+                error = _overlap_error(other.name, other.start, other.end, folder_name, start, end)
+            else:
+                error = _overlap_error(folder_name, start, end, other.name, other.start, other.end)
+            if error:
+                errors.append(error)
+        return errors
+
+    def _validate_new_folder(self, folder_name: str) -> List[str]:
+        """
+        Validate a new folder name using the cached interval tree.
+        
+        Only the ranges intersecting the new one are inspected. Falls back to a
+        full validation when the existing folders already have errors of their own.
+        """
+        if not self._tree_built:
+            self._build_tree()
+        date_range = parse_date_range(folder_name)
+        if not self._tree_clean or date_range is None:
+            return super()._validate_new_folder(folder_name)
+        return self._tree_errors(folder_name, date_range[0], date_range[1])
+
+    def _folder_added(self, folder_name: str, start_datetime: datetime.datetime):
+        """Insert the added folder into the interval tree."""
+        if not self._tree_built:
+            return
+        date_range = parse_date_range(folder_name)
+        if date_range is None:
+            self._tree_clean = False
+            return
+        if self._tree_clean and self._tree_errors(folder_name, date_range[0], date_range[1]):
+            # Only possible when validation was skipped
+            self._tree_clean = False
+        key = (date_range[0], start_datetime, self._tree_seq)
+        self._tree_seq += 1
+        self._tree = _insert_interval(self._tree, _IntervalNode(date_range[0], date_range[1], folder_name, key))
 
     def _create_folder(self, folder_path: str) -> bool:
         """Create the folder in memory."""
@@ -1,12 +1,12 @@
 
 import typing
 
-from zuu.simple_string import simple_match
+from zuu.simple_string import _compile_simple_match, simple_match
 
 
 def extract_nested_keys(dct : dict | list, separator: str = '/', current : str = '', yieldComplexStructure : bool = False):
     """
-    Recursively yields all nested keys in a dictionary or list structure as path strings.
+    Yields all nested keys in a dictionary or list structure as path strings.
     Args:
         dct (dict | list): The input dictionary or list to extract keys from.
         separator (str): Separator used in key paths (default '/').
@@ -17,13 +17,13 @@ def extract_nested_keys(dct : dict | list, separator: str = '/', current : str =
     Note:
         This function only yields keys, not values. For key-value pairs, use iter_nested_keys.
     """
-    method = _extract_dict if isinstance(dct, dict) else _extract_list
-    for key, _ in method(dct, separator, current, yieldComplexStructure):
+    # yieldComplexStructure lands in the exclusion slot here, as it always has
+    for key, _ in _extract(dct, isinstance(dct, dict), separator, current, yieldComplexStructure):
         yield key
 
 def _extract_dict(dct : dict, separator : str, current : str, exclusion : list[str] = None, yieldComplexStructure : bool = False):
     """
-    Helper to recursively extract keys and values from a dictionary.
+    Helper to extract keys and values from a dictionary.
     Args:
         dct (dict): The dictionary to process.
         separator (str): Separator for key paths.
@@ -33,23 +33,11 @@ def _extract_dict(dct : dict, separator : str, current : str, exclusion : list[s
     Yields:
         tuple: (key_path, value) for each leaf value.
     """
-    if yieldComplexStructure:
-        yield current, dct
-
-    for k, v in dct.items():
-        new_key = f"{current}{separator}{k}" if current else k
-        if isinstance(v, dict):
-            yield from _extract_dict(v, separator, new_key, exclusion)
-        elif isinstance(v, list):
-            yield from _extract_list(v, separator, new_key, exclusion)
-        else:
-            if exclusion and any(simple_match(mask, new_key) for mask in exclusion):
-                continue
-            yield new_key, v
+    yield from _extract(dct, True, separator, current, exclusion, yieldComplexStructure)
 
 def _extract_list(dct : list, separator : str, current : str, exclusion : list[str] = None, yieldComplexStructure : bool = False):
     """
-    Helper to recursively extract keys and values from a list.
+    Helper to extract keys and values from a list.
     Args:
         dct (list): The list to process.
         separator (str): Separator for key paths.
@@ -59,19 +47,90 @@ def _extract_list(dct : list, separator : str, current : str, exclusion : list[s
     Yields:
         tuple: (key_path, value) for each leaf value.
     """
+    yield from _extract(dct, False, separator, current, exclusion, yieldComplexStructure)
+
+def _mask_predicate(masks):
+    """
+    Build a single predicate telling whether a key matches any of the masks.
+
+    Each mask is compiled once per walk rather than looked up through simple_match
+    for every key. Several masks are grouped by shape so that string keys are
+    tested with one set lookup, one startswith and one endswith call over all
+    exact, 'prefix*' and '*suffix' masks; only 'pre*suf' masks are tried one by one.
+    Masks that cannot be compiled keep the per-key simple_match loop, so they
+    still raise on the first key checked, as before.
+    """
+    try:
+        matchers = tuple(_compile_simple_match(mask) for mask in masks)
+    except Exception:
+        return lambda key: any(simple_match(mask, key) for mask in masks)
+    if len(matchers) == 1:
+        return matchers[0]
+
+    exact, prefixes, suffixes, split = set(), [], [], []
+    for mask, match in zip(masks, matchers):
+        if "*" not in mask:
+            exact.add(mask)
+        elif mask[-1] == "*":
+            prefixes.append(mask[:-1])
+        elif mask[0] == "*":
+            suffixes.append(mask[1:])
+        else:
+            split.append(match)
+    prefixes, suffixes = tuple(prefixes), tuple(suffixes)
+
+    def excluded(key):
+        if type(key) is not str:
+            # non-string dict keys fail (or not) exactly as simple_match does
+            return any(match(key) for match in matchers)
+        return (
+            key in exact
+            or key.startswith(prefixes)
+            or key.endswith(suffixes)
+            or any(match(key) for match in split)
+        )
+    return excluded
+
+def _extract(dct : dict | list, is_dict : bool, separator : str, current : str, exclusion : list[str] = None, yieldComplexStructure : bool = False):
+    """
+    Depth-first walk shared by _extract_dict and _extract_list.
+
+    Uses an explicit stack of (items iterator, head, is_dict, yieldComplexStructure)
+    frames instead of recursion, so depth is not limited by the recursion limit.
+    ``head`` is the frame's path with the separator already appended (None when
+    the path is empty), so each child key costs a single concatenation.
+    Output order matches a recursive pre-order walk. Containers nested in a dict
+    do not yield themselves; containers nested in a list inherit the flag.
+    """
     if yieldComplexStructure:
         yield current, dct
 
-    for i, v in enumerate(dct):
-        new_key = f"{current}{separator}{i}" if current else str(i)
-        if isinstance(v, dict):
-            yield from _extract_dict(v, separator, new_key, exclusion, yieldComplexStructure)
-        elif isinstance(v, list):
-            yield from _extract_list(v, separator, new_key, exclusion, yieldComplexStructure)
-        else:
-            if exclusion and any(simple_match(mask, new_key) for mask in exclusion):
+    excluded = _mask_predicate(exclusion) if exclusion else None
+
+    head = f"{current}{separator}" if current else None
+    stack = [(iter(dct.items()) if is_dict else enumerate(dct), head, is_dict, yieldComplexStructure)]
+    while stack:
+        items, head, in_dict, complex_structure = stack[-1]
+        for k, v in items:
+            if head is not None:
+                new_key = f"{head}{k}"
+            else:
+                new_key = k if in_dict else str(k)
+            if isinstance(v, (dict, list)):
+                child_complex = complex_structure and not in_dict
+                if child_complex:
+                    yield new_key, v
+                child_head = f"{new_key}{separator}" if new_key else None
+                if isinstance(v, dict):
+                    stack.append((iter(v.items()), child_head, True, child_complex))
+                else:
+                    stack.append((enumerate(v), child_head, False, child_complex))
+                break
+            if excluded is not None and excluded(new_key):
                 continue
             yield new_key, v
+        else:
+            stack.pop()
 
 
 def iter_nested_keys(dct : dict | list, separator: str = '/', masks :list[str] = None, iter_type : typing.Literal["key", "value", "both"] = "key", yieldComplexStructure : bool = False):
@@ -91,19 +150,22 @@ def iter_nested_keys(dct : dict | list, separator: str = '/', masks :list[str] =
     Raises:
         ValueError: If iter_type is not one of 'key', 'value', or 'both'.
     """
-    def _internal():
-        current = ''
-        if isinstance(dct, dict):
-            yield from _extract_dict(dct, separator, current, masks, yieldComplexStructure)
-        elif isinstance(dct, list):
-            yield from _extract_list(dct, separator, current, masks, yieldComplexStructure)
-
-    for key in _internal():
-        if iter_type == "key":
-            yield key[0]
-        elif iter_type == "value":
-            yield key[1]
-        elif iter_type == "both":
+    if isinstance(dct, dict):
+        items = _extract(dct, True, separator, '', masks, yieldComplexStructure)
+    elif isinstance(dct, list):
+        items = _extract(dct, False, separator, '', masks, yieldComplexStructure)
+    else:
+        return
+
+    # Dispatch on iter_type once instead of for every item
+    if iter_type == "key":
+        for key, _ in items:
             yield key
-        else:
+    elif iter_type == "value":
+        for _, value in items:
+            yield value
+    elif iter_type == "both":
+        yield from items
+    else:
+        for _ in items:
             raise ValueError("iter_type must be 'key', 'value', or 'both'.")
@@ -1,10 +1,194 @@
-import datetime
+import time
+from collections import deque
 from types import MappingProxyType
 from typing import TypedDict
-from zuu.simple_dict import deep_get, deep_set, deep_pop
-from hashlib import sha1
+from functools import partial
+from operator import itemgetter
+from zuu.simple_dict import deep_get, deep_set, deep_pop, parse_path
+import hashlib
+import struct
 
 _doesNotExist = object()
+_GET_CACHE_SIZE = 256
+
+
+def _blake2b_128(data: bytes = b""):
+    """Default DiffDict hash: 16-byte BLAKE2b, faster than sha1 for change detection."""
+    return hashlib.blake2b(data, digest_size=16)
+
+
+class _BufferedHash:
+    """
+    hashlib-style front for a hashFunc that takes the whole input at once.
+
+    Collects the update() chunks and hands them to func(data) in digest().
+    The result may be a hashlib object (e.g. hashlib.md5(data)) or a
+    ready-made digest; str and other values are turned into bytes.
+    """
+
+    __slots__ = ("_func", "_parts")
+
+    def __init__(self, func):
+        self._func = func
+        self._parts = []
+
+    def update(self, data):
+        self._parts.append(data)
+
+    def digest(self) -> bytes:
+        result = self._func(b"".join(self._parts))
+        if hasattr(result, "digest"):
+            return result.digest()
+        if isinstance(result, bytes):
+            return result
+        return str(result).encode()
+
+
+def _hash_factory(hashFunc):
+    """
+    Adapt hashFunc to a no-argument factory of hashlib-style objects.
+
+    hashlib constructors (and anything else returning an object with update()
+    and digest() when called without arguments) are used as they are; a plain
+    hashFunc(data) callable is wrapped in _BufferedHash.
+    """
+    try:
+        probe = hashFunc()
+    except TypeError:
+        probe = None
+    if hasattr(probe, "update") and hasattr(probe, "digest"):
+        return hashFunc
+    return partial(_BufferedHash, hashFunc)
+
+
+_pack_len = struct.Struct("<Q").pack
+_first = itemgetter(0)
+_pack_float = struct.Struct("<d").pack
+
+
+def _drop_stale_paths(sums: dict, dirty_paths, separator: str) -> dict:
+    """Copy of sums without the dirty paths, anything below them, or their ancestors."""
+    stale = set()
+    prefixes = []
+    for path in dirty_paths:
+        stale.add(path)
+        prefixes.append(f"{path}{separator}")
+        while separator in path:
+            path = path.rpartition(separator)[0]
+            stale.add(path)
+    prefixes = tuple(prefixes)
+    return {
+        key: value for key, value in sums.items()
+        if key not in stale and not (isinstance(key, str) and key.startswith(prefixes))
+    }
+
+
+def _feed(update, obj, active=None):
+    """
+    Stream obj into a hash update function piece by piece.
+
+    Avoids building str(obj) and its encoded copy for large containers. Each
+    value is tagged with its type (and length where variable) so that e.g.
+    1, 1.0, "1" and [1] all feed different bytes. Unknown types fall back to
+    their str() form.
+
+    Dict items are fed in key order, so dicts that compare equal hash the same
+    whatever their insertion order. A container that contains itself feeds a
+    marker where it recurs, as str() writes '[...]', instead of recursing forever;
+    active holds the ids of the containers on the current path.
+    """
+    if isinstance(obj, str):
+        data = obj.encode("utf-8", "surrogatepass")
+        update(b"s")
+        update(_pack_len(len(data)))
+        update(data)
+    elif obj is None:
+        update(b"n")
+    elif isinstance(obj, bool):
+        update(b"t" if obj else b"f")
+    elif isinstance(obj, int):
+        data = obj.to_bytes(obj.bit_length() // 8 + 1, "little", signed=True)
+        update(b"i")
+        update(_pack_len(len(data)))
+        update(data)
+    elif isinstance(obj, float):
+        update(b"d")
+        update(_pack_float(obj))
+    elif isinstance(obj, (dict, list, tuple)):
+        if active is None:
+            active = set()
+        elif id(obj) in active:
+            update(b"r")
+            return
+        active.add(id(obj))
+        if isinstance(obj, dict):
+            update(b"{")
+            update(_pack_len(len(obj)))
+            for k, v in _sorted_items(obj):
+                _feed(update, k, active)
+                _feed(update, v, active)
+        else:
+            update(b"[" if isinstance(obj, list) else b"(")
+            update(_pack_len(len(obj)))
+            if not (obj and _feed_numeric(update, obj)):
+                for v in obj:
+                    _feed(update, v, active)
+        active.discard(id(obj))
+    else:
+        data = str(obj).encode()
+        update(b"?")
+        update(_pack_len(len(data)))
+        update(data)
+
+
+def _key_bytes(key) -> bytes:
+    parts = []
+    _feed(parts.append, key)
+    return b"".join(parts)
+
+
+def _sorted_items(dct: dict) -> list:
+    """Items of dct ordered by key; keys that do not compare are ordered by their fed bytes."""
+    try:
+        return sorted(dct.items(), key=_first)
+    except TypeError:
+        return sorted(dct.items(), key=lambda item: _key_bytes(item[0]))
+
+
+def _feed_numeric(update, seq) -> bool:
+    """
+    Feed a homogeneous float (or int64) sequence as a single packed buffer.
+
+    One struct.pack over the whole row replaces a _feed call per element, which
+    is where most of the time goes for numeric arrays. Returns False when the
+    sequence is not homogeneous so the caller falls back to per-element feeding.
+    """
+    first = type(seq[0])
+    if first is float:
+        if all(type(v) is float for v in seq):
+            update(b"D")
+            update(struct.pack(f"<{len(seq)}d", *seq))
+            return True
+    elif first is int:
+        if all(type(v) is int for v in seq):
+            try:
+                data = struct.pack(f"<{len(seq)}q", *seq)
+            except struct.error:
+                # outside int64, feed element by element
+                return False
+            update(b"I")
+            update(data)
+            return True
+    return False
+
+
+def _as_record(checksum):
+    """Raw digests are compared as bytes and only hex-encoded for the change record."""
+    if checksum is _doesNotExist:
+        return None
+    if isinstance(checksum, bytes):
+        return checksum.hex()
+    return checksum
 
 
 class DiffSet(TypedDict):
@@ -22,7 +206,7 @@ class DiffSet(TypedDict):
 
     Note:
         For primitive types (str, int, float), the actual values are stored.
-        For complex objects, SHA1 hashes of their string representations are stored.
+        For complex objects, hex digests of their contents are stored.
     """
 
     key: str
@@ -51,9 +235,12 @@ class DiffDict:
 
     Args:
         data (dict, optional): Initial data to populate the dictionary. Defaults to empty dict.
-        hashFunc (callable, optional): Hash function for change detection. Defaults to sha1.
+        hashFunc (callable, optional): Hash function for change detection. Defaults to 16-byte blake2b.
         stamp (bool, optional): Whether to include timestamps in change records. Defaults to True.
         separator (str, optional): Separator for nested keys. Defaults to "/".
+        maxChanges (int, optional): Cap the change history to this many records. Defaults to None.
+        copyOnWrite (bool, optional): Share data with the caller and copy containers only
+            when they are written to or handed out. Defaults to False.
 
     Example:
         >>> dd = DiffDict()
@@ -72,6 +259,25 @@ class DiffDict:
         >>> dd.updateAtKey("data")  # Notify of change
     """
 
+    __slots__ = (
+        "__data",
+        "__changes",
+        "__keysums",
+        "__hashFunc",
+        "__DoStamp",
+        "__useHexCheck",
+        "__separator",
+        "__get",
+        "__set",
+        "__pop",
+        "__callbacks",
+        "__getCache",
+        "__epoch",
+        "__owned",
+        "__private",
+        "__weakref__",
+    )
+
     @property
     def dataref(self):
         return self.__data
@@ -80,13 +286,20 @@ class DiffDict:
     def dataref(self, value):
         assert isinstance(value, dict), "Data reference must be a dictionary"
         self.__data = value
+        self.__epoch += 1
+        if self.__owned is not None:
+            self.__owned = {}
+            self.__private = set()
 
     def __init__(
         self,
         data: dict = None,
-        hashFunc: callable = sha1,
+        hashFunc: callable = _blake2b_128,
         stamp: bool = True,
         separator: str = "/",
+        maxChanges: int = None,
+        cacheGets: bool = False,
+        copyOnWrite: bool = False,
     ):
         """
         Initialize a new DiffDict instance.
@@ -95,22 +308,120 @@ class DiffDict:
             data (dict, optional): Initial data to populate the dictionary.
                 If None, starts with an empty dictionary. Defaults to None.
             hashFunc (callable, optional): Hash function used for change detection.
-                Must return an object with a hexdigest() method. Defaults to sha1.
+                Either a hashlib-style constructor (hashlib.sha1, hashlib.md5, ...),
+                which is streamed into, or a callable taking the serialized bytes
+                and returning a hashlib object or a digest (e.g.
+                ``lambda b: hashlib.md5(b).digest()``). Defaults to 16-byte blake2b.
             stamp (bool, optional): Whether to include timestamps in change records.
                 If True, each change includes a timestamp. Defaults to True.
             separator (str, optional): String used to separate nested key components.
                 For example, "/" allows keys like "user/profile/name". Defaults to "/".
+            maxChanges (int, optional): If set, the change history is kept in a ring
+                buffer of this size and the oldest records are dropped as new ones
+                arrive. Defaults to None (unbounded).
+            cacheGets (bool, optional): Memoize lookups in __getitem__ and __contains__
+                until the next write through this DiffDict. Only safe when the data
+                is not restructured behind DiffDict's back (e.g. through dataref or
+                a returned container); call updateAtKey after such changes.
+                Defaults to False.
+            copyOnWrite (bool, optional): Keep data by reference and never mutate it.
+                Writes shallow-copy only the containers on the path to the written key,
+                and a container returned by __getitem__ is first replaced by a private
+                deep copy, so in-place edits to it stay local as well. dataref may
+                still share unmodified parts with data. Defaults to False.
         """
         if data is None:
             data = {}
         self.__data = data
-        self.__changes: list[DiffSet] = []
+        self.__changes: list[DiffSet] | deque[DiffSet] = (
+            deque(maxlen=maxChanges) if maxChanges else []
+        )
         self.__keysums = {}
-        self.__hashFunc = hashFunc
+        self.__hashFunc = _hash_factory(hashFunc)
         self.__DoStamp = stamp
         self.__useHexCheck = False
         self.__separator = separator
+        # separator-bound accessors, so hot paths make a single call
+        self.__get = partial(deep_get, separator=separator, default=_doesNotExist)
+        self.__set = partial(deep_set, separator=separator)
+        self.__pop = partial(deep_pop, separator=separator)
         self.__callbacks = []
+        # entries are (epoch, value); any write bumps the epoch, staling them all
+        self.__getCache = {} if cacheGets else None
+        self.__epoch = 0
+        # id -> container copied by this DiffDict (kept alive so ids stay unique);
+        # __private holds the ids whose whole subtree is copied too
+        self.__owned = {} if copyOnWrite else None
+        self.__private = set() if copyOnWrite else None
+
+    def __adopt(self, node):
+        copied = node.copy()
+        self.__owned[id(copied)] = copied
+        return copied
+
+    def __privatize(self, key):
+        """
+        Copy every shared container from the root down to the parent of key.
+
+        Returns:
+            The parent container of key, or None if the path stops early.
+        """
+        owned = self.__owned
+        node = self.__data
+        if id(node) not in owned:
+            node = self.__data = self.__adopt(node)
+        for k, idx in parse_path(key, self.__separator)[:-1]:
+            if isinstance(node, dict):
+                slot = k
+                child = node.get(k)
+            elif isinstance(node, list) and idx is not None and idx < len(node):
+                slot = idx
+                child = node[idx]
+            else:
+                return None
+            if not isinstance(child, (dict, list)):
+                return None
+            if id(child) not in owned:
+                child = node[slot] = self.__adopt(child)
+            node = child
+        return node
+
+    def __own_tree(self, node):
+        """Private deep copy of node, reusing any part that is private already."""
+        if id(node) in self.__private:
+            return node
+        if id(node) not in self.__owned:
+            node = self.__adopt(node)
+        for slot, child in list(node.items() if isinstance(node, dict) else enumerate(node)):
+            if isinstance(child, (dict, list)):
+                node[slot] = self.__own_tree(child)
+        self.__private.add(id(node))
+        return node
+
+    def __own_value(self, key, value):
+        """Swap the container at key for a private copy before handing it out."""
+        parent = self.__privatize(key)
+        k, idx = parse_path(key, self.__separator)[-1]
+        private = self.__own_tree(value)
+        parent[k if isinstance(parent, dict) else idx] = private
+        self.__epoch += 1
+        return private
+
+    def __release(self, node):
+        """
+        Forget the copies in a subtree that is being replaced or removed, so
+        __owned only keeps containers that can still be reached. A copy that
+        turns out to be referenced elsewhere is merely copied again on write.
+        """
+        owned = self.__owned
+        private = self.__private
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, (dict, list)) or owned.pop(id(node), None) is None:
+                continue
+            private.discard(id(node))
+            stack.extend(node.values() if isinstance(node, dict) else node)
 
     def prune_changes(self, keep: int = 256):
         """
@@ -134,10 +445,18 @@ class DiffDict:
             >>> len(dd.changes["all"])  # Only last 100 kept
             100
         """
-        if keep <= 0:
-            self.__changes = []
+        changes = self.__changes
+        keep = max(keep, 0)
+        if len(changes) <= keep:
+            # nothing to drop, so don't copy the history
+            return
+        drop = len(changes) - keep
+        if isinstance(changes, deque):
+            # ring buffer: trim in place, the history stays capped at maxlen
+            for _ in range(drop):
+                changes.popleft()
         else:
-            self.__changes = self.__changes[-keep:]
+            del changes[:drop]
 
     def add_callback(self, callback: callable):
         """
@@ -168,18 +487,19 @@ class DiffDict:
         Get a read-only view of the change history.
 
         Returns a MappingProxyType containing the complete change history and
-        quick access to the most recent change. The returned object is immutable
+        quick access to the most recent change. The mapping itself is immutable
         to prevent accidental modification of the change history.
 
         Returns:
             MappingProxyType: Dictionary-like object with keys:
-                - "all": List of all change records (DiffSet objects)
+                - "all": All change records (DiffSet objects); a deque when
+                  maxChanges is set
                 - "last": Most recent change record, or None if no changes
 
         Note:
-            The returned object is a snapshot. If more changes are made after
-            getting this property, you need to access the property again to
-            see the new changes.
+            "all" is the live history, not a copy, so it follows later changes
+            and prune_changes(); take list(...) of it for a snapshot. "last" is
+            fixed when the property is read.
 
         Example:
             >>> dd = DiffDict()
@@ -189,10 +509,11 @@ class DiffDict:
             >>> changes["last"]["key"]  # "key"
             >>> changes["last"]["new"]  # "value"
         """
+        changes = self.__changes
         return MappingProxyType(
             {
-                "all": self.__changes,
-                "last": self.__changes[-1] if self.__changes else None,
+                "all": changes,
+                "last": changes[-1] if changes else None,
             }
         )
 
@@ -219,6 +540,20 @@ class DiffDict:
         """
         self.__useHexCheck = value
 
+    def __digest(self, val):
+        """
+        Hash a value by streaming it into a fresh hash object (see _hash_factory).
+
+        Args:
+            val: Value to hash
+
+        Returns:
+            bytes: Raw digest of the value
+        """
+        h = self.__hashFunc()
+        _feed(h.update, val)
+        return h.digest()
+
     def __compare(self, key, val1, val2, hash1=_doesNotExist, hash2=_doesNotExist, callback : bool = True):
         """
         Internal method to compare two values and record changes.
@@ -236,21 +571,36 @@ class DiffDict:
 
         Returns:
             bool: True if a change was recorded, False if values are identical
+
+        Note:
+            hashFunc is only invoked on change candidates. When no checksum is
+            known for the previous value yet, the same object (or an equal str/int)
+            is ruled out up front, since both sides would hash identically.
         """
         if key in self.__keysums:
             hash1 = self.__keysums[key]
+        elif (
+            hash1 is _doesNotExist
+            and hash2 is _doesNotExist
+            and val1 is not _doesNotExist
+            and (
+                val1 is val2
+                or (type(val1) is type(val2) and type(val1) in (str, int, bool) and val1 == val2)
+            )
+        ):
+            return False
 
         if val1 is not _doesNotExist and hash1 is _doesNotExist:
             if isinstance(val1, (str, int, float)):
                 hash1 = str(val1)
             else:
-                hash1 = self.__hashFunc(str(val1).encode()).hexdigest()
+                hash1 = self.__digest(val1)
 
         if val2 is not _doesNotExist and hash2 is _doesNotExist:
             if isinstance(val2, (str, int, float)):
                 hash2 = str(val2)
             else:
-                hash2 = self.__hashFunc(str(val2).encode()).hexdigest()
+                hash2 = self.__digest(val2)
 
         if hash1 is not _doesNotExist and hash2 is not _doesNotExist:
             if hash1 == hash2:
@@ -266,9 +616,9 @@ class DiffDict:
         self.__changes.append(
             DiffSet(
                 key=key,
-                stamp=datetime.datetime.now().timestamp() if self.__DoStamp else None,
-                previous=hash1 if hash1 is not _doesNotExist else None,
-                new=hash2 if hash2 is not _doesNotExist else None,
+                stamp=time.time() if self.__DoStamp else None,
+                previous=_as_record(hash1),
+                new=_as_record(hash2),
             )
         )
         if callback and len(self.__callbacks) > 0:
@@ -285,17 +635,21 @@ class DiffDict:
         Args:
             key: The key where the object was modified
 
+        Returns:
+            bool: True if a change was recorded
+
         Raises:
             KeyError: If the key doesn't exist in the dictionary
         """
-        current_value = deep_get(self.__data, key, self.__separator, _doesNotExist)
+        current_value = self.__get(self.__data, key)
         if current_value is _doesNotExist:
             raise KeyError(f"Key '{key}' not found")
 
         # Get the stored hash and force a comparison with the current value
         # This will detect if the object has been modified externally
         old_hash = self.__keysums.get(key, _doesNotExist)
-        self.__compare(key, current_value, current_value, hash1=old_hash)
+        self.__epoch += 1
+        return self.__compare(key, current_value, current_value, hash1=old_hash)
 
     def update_all(self, include_new_keys: bool = False):
         """
@@ -351,11 +705,7 @@ class DiffDict:
         for key in tracked_keys:
             try:
                 # updateAtKey will only record a change if the hash differs
-                changes_before_key = len(self.__changes)
-                self.updateAtKey(key)
-                
-                # Check if a change was actually recorded
-                if len(self.__changes) > changes_before_key:
+                if self.updateAtKey(key):
                     result["changed"].append(key)
                     
             except KeyError:
@@ -423,7 +773,63 @@ class DiffDict:
 
         # Check if the value is the same
         if self.__compare(key, previousVal, value):
-            deep_set(self.__data, key, value, self.__separator)
+            if self.__owned is not None:
+                self.__release(self.__get(self.__data, key))
+                self.__privatize(key)
+            self.__set(self.__data, key, value)
+            self.__epoch += 1
+
+    def bulk_update(self, pairs) -> int:
+        """
+        Set many key/value pairs at once, recording a change for each one.
+
+        Equivalent to assigning each pair with dd[key] = value, but attribute
+        lookups are hoisted out of the loop and callbacks are invoked once
+        after the whole batch instead of once per change.
+
+        Args:
+            pairs: Iterable of (key, value) tuples, or a mapping.
+
+        Returns:
+            int: Number of changes recorded.
+
+        Example:
+            >>> dd = DiffDict()
+            >>> dd.bulk_update({"a": 1, "b/c": [1, 2]})
+            2
+        """
+        if hasattr(pairs, "items"):
+            pairs = pairs.items()
+
+        data = self.__data
+        data_get = data.get
+        set_value = self.__set
+        compare = self.__compare
+        hex_check = self.__useHexCheck
+        privatize = self.__privatize if self.__owned is not None else None
+        release = self.__release
+        recorded = 0
+
+        for key, value in pairs:
+            previousVal = data_get(key, _doesNotExist)
+            if not hex_check and previousVal == value:
+                continue
+            if compare(key, previousVal, value, callback=False):
+                if privatize is not None:
+                    release(self.__get(data, key))
+                    privatize(key)
+                    # the first write swaps in a private root
+                    data = self.__data
+                    data_get = data.get
+                set_value(data, key, value)
+                recorded += 1
+
+        self.__epoch += 1
+
+        if recorded and self.__callbacks:
+            for callback in self.__callbacks:
+                callback(self)
+        return recorded
 
     def pop(self, key, default=_doesNotExist):
         """
@@ -449,13 +855,20 @@ class DiffDict:
             >>> value = dd.pop("temp")  # Returns "temporary"
             >>> "temp" in dd  # False
         """
-        previousVal = deep_get(self.__data, key, self.__separator, _doesNotExist)
+        previousVal = self.__get(self.__data, key)
         if previousVal is _doesNotExist:
             if default is _doesNotExist:
                 raise KeyError(f"Key '{key}' not found")
             return default
         self.__compare(key, previousVal, _doesNotExist)
-        deep_pop(self.__data, key, self.__separator)
+        if self.__owned is not None:
+            if isinstance(previousVal, (dict, list)):
+                # the caller gets a private copy, the shared original stays untouched
+                previousVal = self.__own_tree(previousVal)
+            self.__release(previousVal)
+            self.__privatize(key)
+        self.__pop(self.__data, key)
+        self.__epoch += 1
         return previousVal
 
     def __getitem__(self, key):
@@ -479,9 +892,24 @@ class DiffDict:
             >>> dd["user/profile/name"] = "Alice"
             >>> name = dd["user/profile/name"]  # "Alice"
         """
-        res = deep_get(self.__data, key, self.__separator, _doesNotExist)
+        cache = self.__getCache
+        if cache is not None:
+            hit = cache.get(key)
+            if hit is not None and hit[0] == self.__epoch:
+                return hit[1]
+        res = self.__get(self.__data, key)
         if res is _doesNotExist:
             raise KeyError(f"Key '{key}' not found")
+        if (
+            self.__owned is not None
+            and isinstance(res, (dict, list))
+            and id(res) not in self.__private
+        ):
+            res = self.__own_value(key, res)
+        if cache is not None:
+            if len(cache) >= _GET_CACHE_SIZE:
+                cache.clear()
+            cache[key] = (self.__epoch, res)
         return res
 
     def __contains__(self, key):
@@ -504,10 +932,12 @@ class DiffDict:
             >>> "user/profile" in dd       # True (partial path)
             >>> "user/email" in dd         # False
         """
-        return (
-            deep_get(self.__data, key, self.__separator, _doesNotExist)
-            is not _doesNotExist
-        )
+        cache = self.__getCache
+        if cache is not None:
+            hit = cache.get(key)
+            if hit is not None and hit[0] == self.__epoch:
+                return True
+        return self.__get(self.__data, key) is not _doesNotExist
 
     def __delitem__(self, key):
         """
@@ -549,15 +979,118 @@ class DiffDict:
         """
         return len(self.__data)
 
-    def update_keysums(self, update : bool = False, overwrite : bool = False):
+    def subtree_keysums(self, dirty_paths=None, previous : dict = None) -> dict:
+        """
+        Digest of every nested dict below the root, keyed by its path.
+
+        Computed bottom-up: a dict's digest covers its keys and the digests of
+        its child dicts, so each node is hashed once instead of once per ancestor.
+
+        Args:
+            dirty_paths (iterable, optional): Key paths modified since previous was built.
+            previous (dict, optional): Result of an earlier call. With dirty_paths, only
+                the dicts at or below a dirty path and their ancestor chains are rehashed;
+                every other child digest is reused from it.
+
+        Returns:
+            dict: Mapping of nested key path to raw digest bytes.
+        """
+        separator = self.__separator
+        hashFunc = self.__hashFunc
+        if dirty_paths is not None and previous is not None and "" not in dirty_paths:
+            sums = _drop_stale_paths(previous, dirty_paths, separator)
+        else:
+            sums = {}
+
+        def _walk(node, path):
+            h = hashFunc()
+            update = h.update
+            update(b"{")
+            update(_pack_len(len(node)))
+            for k, v in node.items():
+                _feed(update, k)
+                if isinstance(v, dict):
+                    update(b"#")
+                    child = f"{path}{separator}{k}" if path else str(k)
+                    digest = sums.get(child)
+                    update(digest if digest is not None else _walk(v, child))
+                else:
+                    _feed(update, v)
+            digest = h.digest()
+            if path:
+                sums[path] = digest
+            return digest
+
+        if isinstance(self.__data, dict):
+            _walk(self.__data, "")
+        return sums
+
+    def __refresh_root(self, path):
+        """
+        Shallowest list on path, since a write below it may have shifted its
+        elements (pop) or replaced one wholesale (deep_set); otherwise path itself.
+        """
+        separator = self.__separator
+        node = self.__data
+        head = ""
+        for part in path.split(separator):
+            if isinstance(node, list):
+                return head
+            if not isinstance(node, dict) or part not in node:
+                break
+            head = f"{head}{separator}{part}" if head else part
+            node = node[part]
+        return path
+
+    def __leafsum(self, value):
+        if isinstance(value, (str, int, float)) and not self.__useHexCheck:
+            return str(value)
+        return self.__digest(value)
+
+    def update_keysums(self, update : bool = False, overwrite : bool = False, dirty_paths=None, previous : dict = None):
+        """
+        Checksum of every leaf key path, plus the whole structure under "".
+
+        Args:
+            update (bool): Merge the result into the tracked keysums.
+            overwrite (bool): Replace the tracked keysums with the result.
+            dirty_paths (iterable, optional): Key paths modified since previous was built.
+            previous (dict, optional): Result of an earlier call. With dirty_paths, only
+                leaves at or below a dirty path are rehashed and the rest are reused.
+
+        Returns:
+            dict | None: The checksum map, unless update or overwrite is set.
+        """
         from zuu.dict_patterns import iter_nested_keys
 
-        map = {}
-        for key, value in iter_nested_keys(self.__data, self.__separator, iter_type="both", yieldComplexStructure=True):
-            if isinstance(value, (str, int, float)) and not self.__useHexCheck:
-                map[key] = str(value)
-            else:
-                map[key] = self.__hashFunc(str(value).encode()).hexdigest()
+        separator = self.__separator
+        if (
+            dirty_paths is not None and previous is not None
+            and isinstance(self.__data, dict) and "" not in dirty_paths
+        ):
+            roots = {self.__refresh_root(path) for path in dirty_paths}
+            map = _drop_stale_paths(previous, roots, separator)
+            for path in roots:
+                # an ancestor that is now a plain value is a leaf again
+                head = path
+                while separator in head:
+                    head = head.rpartition(separator)[0]
+                    value = self.__get(self.__data, head)
+                    if value is not _doesNotExist and not isinstance(value, (dict, list)):
+                        map[head] = self.__leafsum(value)
+                value = self.__get(self.__data, path)
+                if value is _doesNotExist:
+                    continue
+                if isinstance(value, (dict, list)):
+                    for key, leaf in iter_nested_keys(value, separator, iter_type="both"):
+                        map[f"{path}{separator}{key}"] = self.__leafsum(leaf)
+                else:
+                    map[path] = self.__leafsum(value)
+            map[""] = self.__digest(self.__data)
+        else:
+            map = {}
+            for key, value in iter_nested_keys(self.__data, separator, iter_type="both", yieldComplexStructure=True):
+                map[key] = self.__leafsum(value)
         
         if overwrite:
             self.__keysums = map
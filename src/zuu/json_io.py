@@ -2,12 +2,15 @@
 import json
 
 def read_json(file_path) -> dict | list:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # one bulk read and decode instead of going through a text wrapper
+    with open(file_path, 'rb') as f:
+        return json.loads(f.read().decode('utf-8'))
     
 def write_json(file_path: str, data: dict | list):
+    # json.dump issues a write() per encoder chunk; serialize once and write once
+    text = json.dumps(data, ensure_ascii=False, indent=4)
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.write(text)
 
 
 
@@ -22,8 +25,7 @@ def overwrite_json(file_path : str, data : dict | list, preserve : list[str] = N
             deep_set(data, k, v)
            
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    write_json(file_path, data)
 
 
 
@@ -16,6 +16,19 @@ Example:
     True
 """
 
+_WEEKDAYS = frozenset({
+    'monday', 'tuesday', 'wednesday', 'thursday',
+    'friday', 'saturday', 'sunday'
+})
+
+# Valid month names (both full and abbreviated)
+_MONTHS = frozenset({
+    'jan', 'january', 'feb', 'february', 'mar', 'march',
+    'apr', 'april', 'may', 'jun', 'june',
+    'jul', 'july', 'aug', 'august', 'sep', 'september',
+    'oct', 'october', 'nov', 'november', 'dec', 'december'
+})
+
 
 def is_year(string):
     """
@@ -117,6 +130,21 @@ def is_year_month_day(string, sep: str = "-", year_func=is_year_2000s):
         >>> is_year_month_day("1999-01-01", year_func=is_year)
         True
     """
+    # fixed-width YYYY{sep}MM{sep}DD with ASCII digits, checked per character
+    # without split/int; anything else (e.g. other decimal digits) falls through
+    if len(string) == 10 and string[4] == sep and string[7] == sep:
+        m1, m2, d1, d2 = string[5], string[6], string[8], string[9]
+        if (
+            (m1 == '0' and '1' <= m2 <= '9' or m1 == '1' and '0' <= m2 <= '2')
+            and (
+                d1 == '0' and '1' <= d2 <= '9'
+                or '1' <= d1 <= '2' and '0' <= d2 <= '9'
+                or d1 == '3' and '0' <= d2 <= '1'
+            )
+        ):
+            year = string[:4]
+            return sep not in year and year_func(year)
+
     parts = string.split(sep)
     # only 2 sep
     if len(parts) != 3:
@@ -185,6 +213,17 @@ def is_time(string: str, sep: str = ".") -> bool:
         >>> is_time("12:30:45", sep=":")
         True
     """
+    # fixed-width HH{sep}MM{sep}SS with ASCII digits, checked per character
+    # without split/int; anything else (e.g. other decimal digits) falls through
+    if len(string) == 8 and string[2] == sep and string[5] == sep:
+        h1, h2 = string[0], string[1]
+        if (
+            ('0' <= h1 <= '1' and '0' <= h2 <= '9' or h1 == '2' and '0' <= h2 <= '3')
+            and '0' <= string[3] <= '5' and '0' <= string[4] <= '9'
+            and '0' <= string[6] <= '5' and '0' <= string[7] <= '9'
+        ):
+            return True
+
     parts = string.split(sep)
     return (
         len(parts) == 3
@@ -220,11 +259,7 @@ def is_weekday_pattern(string: str) -> bool:
         return False
     
     weekday = string[6:].lower()  # Remove "every_" prefix
-    valid_weekdays = {
-        'monday', 'tuesday', 'wednesday', 'thursday', 
-        'friday', 'saturday', 'sunday'
-    }
-    return weekday in valid_weekdays
+    return weekday in _WEEKDAYS
 
 
 def is_monthly_date_pattern(string: str) -> bool:
@@ -258,14 +293,6 @@ def is_monthly_date_pattern(string: str) -> bool:
     month_part, day_part = parts
     month_part = month_part.lower()
     
-    # Valid month names (both full and abbreviated)
-    valid_months = {
-        'jan', 'january', 'feb', 'february', 'mar', 'march',
-        'apr', 'april', 'may', 'jun', 'june',
-        'jul', 'july', 'aug', 'august', 'sep', 'september',
-        'oct', 'october', 'nov', 'november', 'dec', 'december'
-    }
-    
     # Check if day is valid format (01-31)
     if not day_part.isdigit() or len(day_part) != 2:
         return False
@@ -274,7 +301,7 @@ def is_monthly_date_pattern(string: str) -> bool:
     if not (1 <= day_num <= 31):
         return False
     
-    return month_part in valid_months
+    return month_part in _MONTHS
 
 
 def is_monthtext_day(string: str, sep: str = "_") -> bool:
@@ -306,14 +333,6 @@ def is_monthtext_day(string: str, sep: str = "_") -> bool:
     month_part, day_part = parts
     month_part = month_part.lower()
     
-    # Valid month names (both full and abbreviated)
-    valid_months = {
-        'jan', 'january', 'feb', 'february', 'mar', 'march',
-        'apr', 'april', 'may', 'jun', 'june',
-        'jul', 'july', 'aug', 'august', 'sep', 'september',
-        'oct', 'october', 'nov', 'november', 'dec', 'december'
-    }
-    
     # Check if day is valid format (01-31)
     if not day_part.isdigit() or len(day_part) != 2:
         return False
@@ -322,7 +341,7 @@ def is_monthtext_day(string: str, sep: str = "_") -> bool:
     if not (1 <= day_num <= 31):
         return False
     
-    return month_part in valid_months
+    return month_part in _MONTHS
 
 
 def is_weekday(string: str) -> bool:
@@ -344,8 +363,4 @@ def is_weekday(string: str) -> bool:
         False
     """
     weekday = string.lower()
-    valid_weekdays = {
-        'monday', 'tuesday', 'wednesday', 'thursday', 
-        'friday', 'saturday', 'sunday'
-    }
-    return weekday in valid_weekdays
+    return weekday in _WEEKDAYS
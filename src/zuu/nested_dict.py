@@ -1,3 +1,45 @@
+import re
+import sys
+from functools import lru_cache
+
+# camelCase splitter, compiled once: "getUserURL" -> ("get", "User", "URL")
+_CAMEL_RE = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)')
+
+# the token caches are unbounded; compute_nested clears them past this many entries.
+# They are deliberately process-local: re-tokenizing is a single regex pass per
+# string, cheaper than loading a persisted cache at import.
+_TOKEN_CACHE_LIMIT = 100_000
+
+
+@lru_cache(maxsize=None)
+def _tokenize(s : str) -> tuple:
+    """Split a camelCase string into tokens, cached per string"""
+    return tuple(_CAMEL_RE.findall(s))
+
+
+@lru_cache(maxsize=None)
+def _key_tokens(s : str) -> tuple:
+    """(lowercased, capitalized) casings of each key token, computed once per key"""
+    # lowercase forms are interned, like in _group_tokens, so removal probes match by identity
+    return tuple((sys.intern(t.lower()), t.capitalize()) for t in _tokenize(s))
+
+
+def _join_camel(tokens : tuple) -> str:
+    """lowerCamelCase name from _key_tokens casings, built with a single join"""
+    return ''.join([tokens[0][0], *(cap for _, cap in tokens[1:])])
+
+
+@lru_cache(maxsize=None)
+def _camel_key(s : str) -> str:
+    """Re-cased name of a key whose tokens were all kept, cached per key"""
+    tokens = _key_tokens(s)
+    return _join_camel(tokens) if tokens else s
+
+
+@lru_cache(maxsize=None)
+def _group_tokens(s : str) -> frozenset:
+    """Lowercased token set of a group name, cached per string"""
+    return frozenset(sys.intern(t.lower()) for t in _tokenize(s))
 
 
 def flatten_dict(dct : dict, sep : str = ".", maxDepth : int = -1) -> dict:
@@ -12,17 +54,21 @@ def flatten_dict(dct : dict, sep : str = ".", maxDepth : int = -1) -> dict:
     Returns:
         dict: Flattened dictionary with keys as paths.
     """
-    def _flatten(d, parent_key='', depth=0):
-        items = []
-        for k, v in d.items():
+    # explicit stack of item iterators, so deep nesting costs no Python frames;
+    # draining one iterator at a time keeps the depth-first key order
+    result = {}
+    stack = [('', iter(dct.items()), 0)]
+    while stack:
+        parent_key, items, depth = stack[-1]
+        for k, v in items:
             new_key = f"{parent_key}{sep}{k}" if parent_key else k
             if isinstance(v, dict) and (maxDepth == -1 or depth < maxDepth):
-                items.extend(_flatten(v, new_key, depth + 1).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
-
-    return _flatten(dct)
+                stack.append((new_key, iter(v.items()), depth + 1))
+                break
+            result[new_key] = v
+        else:
+            stack.pop()
+    return result
     
 def unflatten_dict(dct : dict, sep : str = ".") -> dict:
     """
@@ -40,9 +86,7 @@ def unflatten_dict(dct : dict, sep : str = ".") -> dict:
         parts = key.split(sep)
         current = result
         for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+            current = current.setdefault(part, {})
         current[parts[-1]] = value
     return result
 
@@ -59,6 +103,96 @@ def is_nested_dict(dct : dict) -> bool:
     return any(isinstance(v, dict) for v in dct.values())
 
 
+def _strip_tokens(key_tokens : tuple, group_tokens_lower : frozenset) -> tuple:
+    """Drop the key tokens shared with a group"""
+    kept = tuple(pair for pair in key_tokens if pair[0] not in group_tokens_lower)
+    # hand back the same tuple when nothing was dropped
+    return key_tokens if len(kept) == len(key_tokens) else kept
+
+
+def _nest_keys(keys : list, level_groups : list) -> dict:
+    """
+    compute_nested core, after validation and level ordering.
+    
+    Args:
+        keys (list): Keys to place
+        level_groups (list): Per level, a (group names aligned with keys, keep key tokens) pair
+    
+    Returns:
+        dict: Nested dictionary structure with grouped keys
+    """
+    # Per-key state, advanced one level at a time
+    result = {}
+    key_tokens = [_key_tokens(key) for key in keys]
+    current_tokens = list(key_tokens)
+    nodes = [result] * len(keys)
+    
+    for names, keep_tokens in level_groups:
+        if not keep_tokens:
+            # Batch keys by group, so each group's token set is fetched once per level
+            by_group = {}
+            for i, group_name in enumerate(names):
+                by_group.setdefault(group_name, []).append(i)
+            for group_name, indices in by_group.items():
+                group_tokens = _group_tokens(group_name)
+                for i in indices:
+                    current_tokens[i] = _strip_tokens(current_tokens[i], group_tokens)
+        
+        # Descend in key order, so every nested dict keeps first-seen ordering
+        for i, group_name in enumerate(names):
+            nodes[i] = nodes[i].setdefault(group_name, {})
+    
+    for i, key in enumerate(keys):
+        # Create final key from remaining tokens
+        tokens = current_tokens[i]
+        if tokens is key_tokens[i]:
+            # nothing was stripped: the re-cased key is cached
+            final_key = _camel_key(key)
+        elif tokens:
+            final_key = _join_camel(tokens)
+        else:
+            # If no tokens remain, use original key
+            final_key = key
+        
+        nodes[i][final_key] = key
+    
+    return result
+
+
+def _nest_single(keys : list, supp_dict : dict, keep_tokens : bool) -> dict:
+    """_nest_keys specialized to a single supplementary dict"""
+    # Inverted group -> keys index in one pass; first-seen order of both groups
+    # and keys matches what a per-key insertion would produce
+    members = {}
+    for key in keys:
+        group_name = supp_dict[key]
+        if type(group_name) is str:
+            group_name = sys.intern(group_name)
+        members.setdefault(group_name, []).append(key)
+    
+    # dict.fromkeys on a dict is presized, so filling the groups in never resizes it
+    result = dict.fromkeys(members)
+    for group_name, group_keys in members.items():
+        group_tokens = None if keep_tokens else _group_tokens(group_name)
+        final_keys = []
+        for key in group_keys:
+            tokens = key_tokens = _key_tokens(key)
+            if group_tokens is not None:
+                tokens = _strip_tokens(key_tokens, group_tokens)
+            
+            if tokens is key_tokens:
+                final_keys.append(_camel_key(key))
+            elif tokens:
+                final_keys.append(_join_camel(tokens))
+            else:
+                final_keys.append(key)
+        
+        # leaves in one C-level pass; a repeated name keeps its first slot and last key
+        result[group_name] = dict(zip(final_keys, group_keys))
+    
+    return result
+
+
 def compute_nested(keys : list, *dicts : list[(dict, int)], sep : str = ".", keys_weight = 10, maxlv = -1):
     """
     Computes a nested structure by grouping keys based on supplementary dictionaries,
@@ -80,97 +214,52 @@ def compute_nested(keys : list, *dicts : list[(dict, int)], sep : str = ".", key
     for d in dicts:
         if not isinstance(d, tuple) or len(d) != 2 or not isinstance(d[0], dict) or not isinstance(d[1], int):
             raise TypeError("Each dict must be a tuple of (dict, int)")
-        
-        # check if all keys exist in the dictionary
-        dict_keys = set(d[0].keys())
+    
+    if dicts:
+        # check if all keys exist in every dictionary
         keys_set = set(keys)
-        if not keys_set.issubset(dict_keys):
-            missing_keys = keys_set - dict_keys
-            raise ValueError(f"Dictionary missing keys: {missing_keys}")
-    
-    def _split_camel_case(s):
-        """Split camelCase string into tokens"""
-        import re
-        return re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)', s)
-    
-    def _remove_common_tokens(key_tokens, group_tokens, keys_weight, group_weight):
-        """Remove common tokens based on weight priority"""
-        key_tokens_lower = [t.lower() for t in key_tokens]
-        group_tokens_lower = [t.lower() for t in group_tokens]
-        
-        # Find common tokens
-        common_tokens = set(key_tokens_lower) & set(group_tokens_lower)
-        
-        result_tokens = []
-        for token in key_tokens:
-            token_lower = token.lower()
-            if token_lower in common_tokens:
-                # Keep token from source with higher weight
-                if keys_weight > group_weight:
-                    result_tokens.append(token)
-                # If group weight is higher or equal, skip this token (remove it)
-            else:
-                # Token not common, keep it
-                result_tokens.append(token)
-        
-        return result_tokens
+        for supp_dict, _ in dicts:
+            missing_keys = keys_set.difference(supp_dict)
+            if missing_keys:
+                raise ValueError(f"Dictionary missing keys: {missing_keys}")
     
-    # Process each key
-    result = {}
+    if not keys:
+        return {}
     
-    for key in keys:
-        key_tokens = _split_camel_case(key)
-        
-        # Collect all groups from all supplementary dicts with their weights
-        groups_data = []
-        
-        for supp_dict, weight in dicts:
-            if key in supp_dict:
-                group_name = supp_dict[key]
-                group_tokens = _split_camel_case(group_name)
-                groups_data.append((group_name, group_tokens, weight))
-        
-        if not groups_data:
-            # No group found, skip this key or use key as its own group
-            if maxlv == 0:
-                result[key] = key
-            continue
-        
-        # Sort groups by weight (descending) to prioritize higher weights
-        groups_data.sort(key=lambda x: x[2], reverse=True)
-        
-        # Start with the original key tokens
-        current_tokens = key_tokens[:]
-        path_components = []
-        
-        # Process each group level (respecting maxlv)
-        for level, (group_name, group_tokens, group_weight) in enumerate(groups_data):
-            if maxlv != -1 and level >= maxlv:
-                break
-                
-            # Remove common tokens between current tokens and this group
-            remaining_tokens = _remove_common_tokens(current_tokens, group_tokens, keys_weight, group_weight)
-            
-            # Add group to path
-            path_components.append(group_name)
-            
-            # Update current tokens for next iteration
-            current_tokens = remaining_tokens
-        
-        # Create final key from remaining tokens
-        if current_tokens:
-            final_key = current_tokens[0].lower() + ''.join(t.capitalize() for t in current_tokens[1:])
-        else:
-            # If no tokens remain, use original key
-            final_key = key
-        
-        # Build nested structure
-        current_dict = result
-        for component in path_components:
-            if component not in current_dict:
-                current_dict[component] = {}
-            current_dict = current_dict[component]
-        
-        current_dict[final_key] = key
+    if not dicts:
+        # No groups at all: keys map to themselves only when nesting is disabled
+        return dict(zip(keys, keys)) if maxlv == 0 else {}
+    
+    if _tokenize.cache_info().currsize > _TOKEN_CACHE_LIMIT:
+        _tokenize.cache_clear()
+        _key_tokens.cache_clear()
+        _camel_key.cache_clear()
+        _group_tokens.cache_clear()
+    
+    if len(dicts) == 1 and (maxlv == -1 or maxlv > 0):
+        # the common one-dict call is a single level: no sorting or per-level lists
+        supp_dict, group_weight = dicts[0]
+        return _nest_single(keys, supp_dict, keys_weight > group_weight)
+    
+    # Order the supplementary dicts by weight (descending) once for all keys; the
+    # sort is stable, so equal weights keep argument order. maxlv cuts this order.
+    if maxlv == 0:
+        # flat result: no group is ever used, keys are only re-cased below
+        levels = []
+    else:
+        levels = sorted(dicts, key=lambda x: x[1], reverse=True)
+        if maxlv != -1:
+            levels = levels[:max(maxlv, 0)]
+    
+    # Per level: the group name of each key (by position in keys), interned so a
+    # name repeated across keys is a single object when keying the result, and
+    # whether the keys outweigh the group (then the key's own tokens are kept)
+    level_groups = []
+    for supp_dict, group_weight in levels:
+        names = []
+        for key in keys:
+            group_name = supp_dict[key]
+            names.append(sys.intern(group_name) if type(group_name) is str else group_name)
+        level_groups.append((names, keys_weight > group_weight))
     
-    return result
\ No newline at end of file
+    return _nest_keys(keys, level_groups)
\ No newline at end of file
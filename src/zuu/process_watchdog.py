@@ -1,13 +1,20 @@
 import datetime
 import logging
+import os
 import re
+import sys
 from typing import TypedDict
 import psutil
 import sched
 
 scheduler = sched.scheduler()
 
-class ProcessCtx(TypedDict):
+class _ProcessCtxCache(TypedDict, total=False):
+    # filled in by new_ctx and the watchdog heartbeats, not by callers
+    _name: str
+    _proc: psutil.Process | None
+
+class ProcessCtx(_ProcessCtxCache):
     process: psutil.Process | str
     pid : int | None
     lifetime: int
@@ -24,7 +31,10 @@ def new_ctx(process: psutil.Process | str, lifetime: int,  pid: int | None = Non
     Returns:
         ProcessCtx: The new process context.
     """
-    return ProcessCtx(process=process, pid=pid, lifetime=lifetime)
+    ctx = ProcessCtx(process=process, pid=pid, lifetime=lifetime)
+    # resolve the display name once, heartbeats only read it back
+    ctx['_name'] = get_process_name(ctx)
+    return ctx
 
 def match_process(ctx : ProcessCtx) -> psutil.Process | None:
     """
@@ -38,6 +48,27 @@ def match_process(ctx : ProcessCtx) -> psutil.Process | None:
     """
     if isinstance(ctx['process'], psutil.Process):
         return ctx['process']
+    elif isinstance(ctx['process'], str) and sys.platform == 'linux':
+        # read /proc/<pid>/comm directly instead of building psutil objects for every pid;
+        # ascending pids, like process_iter, so the first match is the same process
+        for pid in sorted(int(p) for p in os.listdir('/proc') if p.isdigit()):
+            try:
+                with open(f'/proc/{pid}/comm', 'rb') as f:
+                    comm = f.read().rstrip(b'\n')
+            except OSError:
+                continue
+            name = comm.decode(errors='replace')
+            if len(comm) >= 15:
+                # comm is cut at 15 bytes; psutil recovers the full name from cmdline
+                try:
+                    name = psutil.Process(pid).name()
+                except psutil.Error:
+                    pass
+            if re.match(ctx['process'], name.lower()) or (ctx['pid'] is not None and pid == ctx['pid']):
+                try:
+                    return psutil.Process(pid)
+                except psutil.NoSuchProcess:
+                    continue
     elif isinstance(ctx['process'], str):
         for proc in psutil.process_iter(['pid', 'name']):
             if re.match(ctx['process'], proc.info['name'].lower()):
@@ -66,6 +97,21 @@ def get_process_name(ctx : ProcessCtx) -> str:
 
     return "Unknown Process"
 
+def _is_alive(proc : psutil.Process) -> bool:
+    """
+    Check whether a previously matched process is still usable.
+    
+    Args:
+        proc (psutil.Process): The process to check.
+        
+    Returns:
+        bool: True if the process is running and not a zombie.
+    """
+    try:
+        return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
 
 def process_watchdog(
     ctx: ProcessCtx,
@@ -87,8 +133,13 @@ def process_watchdog(
     """
     
     def check_process(ctx, time_to_kill: datetime.datetime):
-        logging.debug(f"[PWatchdog] heartbeat {get_process_name(ctx)}, to be killed at {time_to_kill}")
-        proc = match_process(ctx)
+        name = ctx.get('_name') or get_process_name(ctx)
+        logging.debug(f"[PWatchdog] heartbeat {name}, to be killed at {time_to_kill}")
+        # reuse the process matched on a previous heartbeat, only rescan on a miss
+        proc = ctx.get('_proc')
+        if proc is None or not _is_alive(proc):
+            proc = match_process(ctx)
+            ctx['_proc'] = proc
         if not proc:
             return
         scheduler.enter(ctx["interval"], 1, check_process, (ctx, time_to_kill))
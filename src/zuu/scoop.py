@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import functools
 import json
 import os
 from pathlib import Path
@@ -10,6 +12,8 @@ SCOOP_PATH = Path(os.environ.get('SCOOP')) if "SCOOP" in os.environ else Path.ho
 if not SCOOP_PATH.exists():
     SCOOP_PATH = None
 
+_APPS_PATH = SCOOP_PATH / 'apps' if SCOOP_PATH else None
+
 class ScoopEntry(TypedDict):
     name : str
     version : str
@@ -62,25 +66,49 @@ def scoop_list_filter(
         ]
     return entries
 
+@functools.lru_cache(maxsize=1024)
+def _pkg_dir(pkg : str) -> Path:
+    return _APPS_PATH / pkg
+
 def scoop_pkg_path(pkg : str) -> Path | None:
-    if SCOOP_PATH is None:
+    if _APPS_PATH is None:
         return None
-    pkg_path = SCOOP_PATH / 'apps' / pkg
-    if pkg_path.exists():
+    pkg_path = _pkg_dir(pkg)
+    if pkg_path.is_dir():
         return pkg_path / 'current'
     return None
 
 def scoop_pkg_manifest_path(pkg : str) -> Path | None:
-    if SCOOP_PATH is None:
+    current = scoop_pkg_path(pkg)
+    if current is None:
         return None
-    pkg_path = SCOOP_PATH / 'apps' / pkg
-    if pkg_path.exists():
-        return pkg_path / 'current' / 'manifest.json'
-    return None
+    return current / 'manifest.json'
 
 def scoop_pkg_manifest(pkg : str) -> dict | None:
     manifest_path = scoop_pkg_manifest_path(pkg)
-    if manifest_path and manifest_path.exists():
-        with open(manifest_path) as f:
-            return json.load(f)
-    return None
\ No newline at end of file
+    if manifest_path is None:
+        return None
+    try:
+        return json.loads(manifest_path.read_bytes())
+    except OSError:
+        return None
+
+def scoop_pkg_manifests(pkgs : list[str]) -> dict[str, dict]:
+    # manifests are independent files, overlap the reads instead of loading them one by one
+    paths = {}
+    for pkg in pkgs:
+        manifest_path = scoop_pkg_manifest_path(pkg)
+        if manifest_path:
+            paths[pkg] = manifest_path
+
+    def _load(manifest_path : Path) -> dict | None:
+        try:
+            return json.loads(manifest_path.read_bytes())
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths) or 1)) as executor:
+        loaded = executor.map(_load, paths.values())
+        return {
+            pkg : manifest for pkg, manifest in zip(paths, loaded) if manifest is not None
+        }
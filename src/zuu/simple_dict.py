@@ -1,9 +1,66 @@
 
 import typing
+from functools import lru_cache
 
 
 _throw_error = object()
 
+@lru_cache(maxsize=4096)
+def _split_path(key : str, separator : str) -> tuple:
+    """
+    Splits a key path into a tuple of segments, cached per (key, separator).
+    """
+    return tuple(key.split(separator))
+
+@lru_cache(maxsize=4096)
+def _parse_path(key : str, separator : str) -> tuple:
+    """
+    Splits a key path into (segment, index) pairs, cached per (key, separator).
+    index is the segment as an int when it is all digits, otherwise None.
+    """
+    return tuple((k, int(k) if k.isdecimal() else None) for k in key.split(separator))
+
+def _key_label(key, keys : tuple) -> str:
+    """Key path for error messages; rebuilt from the parsed segments when no key string was given."""
+    return key if key is not None else "/".join(k for k, _ in keys)
+
+def parse_path(key : str, separator : str = '/') -> tuple:
+    """
+    Parses a key path once so it can be reused with deep_get_parts, deep_set_parts
+    and deep_pop_parts without splitting the string again on every call.
+    Args:
+        key: The key path string (e.g., 'a/b/0/c').
+        separator: Separator for splitting the key path (default: '/').
+    Returns:
+        tuple: The parsed path segments.
+    """
+    return _parse_path(key, separator)
+
+def deep_get_parts(dct, parts : tuple, default = _throw_error):
+    """
+    deep_get on a key path parsed with parse_path.
+    Raises:
+        KeyError: If the key path does not exist and no default is provided.
+    """
+    return _deep_get_parts(dct, parts, None, default)
+
+def deep_set_parts(dct, parts : tuple, value):
+    """
+    deep_set on a key path parsed with parse_path.
+    Raises:
+        KeyError: If the key path is invalid.
+        IndexError: If a list index is out of range.
+    """
+    _deep_set_parts(dct, parts, None, value)
+
+def deep_pop_parts(dct, parts : tuple, default = _throw_error):
+    """
+    deep_pop on a key path parsed with parse_path.
+    Raises:
+        KeyError: If the key path does not exist and no default is provided.
+    """
+    return _deep_pop_parts(dct, parts, None, default)
+
 def deep_get(dct, key : str, separator: str = '/', default = _throw_error):
     """
     Recursively retrieves a value from a nested dict or list using a key path.
@@ -17,15 +74,52 @@ def deep_get(dct, key : str, separator: str = '/', default = _throw_error):
     Raises:
         KeyError: If the key path does not exist and no default is provided.
     """
-    keys = key.split(separator)
-    for k in keys:
-        if isinstance(dct, dict) and k in dct:
+    if (type(dct) is dict or isinstance(dct, dict)) and separator not in key:
+        # single segment, a plain dict lookup
+        value = dct.get(key, _throw_error)
+    else:
+        value = _descend(dct, key, separator)
+    if value is not _throw_error:
+        return value
+    if default is _throw_error:
+        raise KeyError(f"Key '{key}' not found in the dictionary.")
+    return default
+
+def _descend(dct, key : str, separator : str):
+    """
+    Walks a key path one segment at a time with str.partition, stopping at the
+    first missing segment without splitting the rest of the path.
+    Returns _throw_error if a segment is missing.
+    """
+    while True:
+        head, found, key = key.partition(separator)
+        if type(dct) is dict:
+            dct = dct.get(head, _throw_error)
+            if dct is _throw_error:
+                return dct
+        elif isinstance(dct, dict) and head in dct:
+            dct = dct[head]
+        elif (type(dct) is list or isinstance(dct, list)) and head.isdecimal() and int(head) < len(dct):
+            dct = dct[int(head)]
+        else:
+            return _throw_error
+        if not found:
+            return dct
+
+def _deep_get_parts(dct, keys : tuple, key : str, default = _throw_error):
+    """
+    deep_get on an already parsed key path; key is only used for error messages.
+    Plain dicts and lists are matched by exact type; subclasses take the slower
+    isinstance check but behave the same.
+    """
+    for k, idx in keys:
+        if (type(dct) is dict or isinstance(dct, dict)) and k in dct:
             dct = dct[k]
-        elif isinstance(dct, list) and k.isdigit() and 0 <= int(k) < len(dct):
-            dct = dct[int(k)]
+        elif (type(dct) is list or isinstance(dct, list)) and idx is not None and idx < len(dct):
+            dct = dct[idx]
         else:
             if default is _throw_error:
-                raise KeyError(f"Key '{key}' not found in the dictionary.")
+                raise KeyError(f"Key '{_key_label(key, keys)}' not found in the dictionary.")
             return default
     return dct
 
@@ -41,32 +135,62 @@ def deep_set(dct, key : str, value, separator: str = '/'):
         KeyError: If the key path is invalid.
         IndexError: If a list index is out of range.
     """
-    keys = key.split(separator)
-    for k in keys[:-1]:
-        if isinstance(dct, dict):
+    if (type(dct) is dict or isinstance(dct, dict)) and separator not in key:
+        dct[key] = value
+        return
+    _deep_set_parts(dct, _parse_path(key, separator), key, value)
+
+def _descend_create(dct, keys : tuple, key : str, action : str):
+    """
+    Walks all but the last parsed segment, creating missing containers on the way.
+    Shared by deep_set and deep_setdefault; action is only used for error messages.
+    """
+    for k, idx in keys[:-1]:
+        if (type(dct) is dict or isinstance(dct, dict)):
             if k not in dct or not isinstance(dct[k], (dict, list)):
                 # If next key is digit, create a list, else dict
-                if k.isdigit():
+                if idx is not None:
                     dct[k] = []
                 else:
                     dct[k] = {}
             dct = dct[k]
-        elif isinstance(dct, list) and k.isdigit():
-            index = int(k)
-            if len(dct) <= index:
-                raise IndexError(f"Index {index} out of range for list at '{key}'.")
+        elif (type(dct) is list or isinstance(dct, list)) and idx is not None:
+            if len(dct) <= idx:
+                raise IndexError(f"Index {idx} out of range for list at '{_key_label(key, keys)}'.")
             # If not dict, set to dict
-            if not isinstance(dct[index], dict):
-                dct[index] = {}
-            dct = dct[index]
+            if not isinstance(dct[idx], dict):
+                dct[idx] = {}
+            dct = dct[idx]
         else:
-            raise KeyError(f"Cannot set value at '{key}': invalid path.")
-    if isinstance(dct, dict):
-        dct[keys[-1]] = value
-    elif isinstance(dct, list) and keys[-1].isdigit():
-        dct[int(keys[-1])] = value
+            raise KeyError(f"Cannot {action} at '{_key_label(key, keys)}': invalid path.")
+    return dct
+
+def _deep_set_parts(dct, keys : tuple, key : str, value):
+    """
+    deep_set on an already parsed key path; key is only used for error messages.
+    """
+    dct = _descend_create(dct, keys, key, "set value")
+    last, idx = keys[-1]
+    if (type(dct) is dict or isinstance(dct, dict)):
+        dct[last] = value
+    elif (type(dct) is list or isinstance(dct, list)) and idx is not None:
+        dct[idx] = value
     else:
-        raise KeyError(f"Cannot set value at '{key}': invalid path.")
+        raise KeyError(f"Cannot set value at '{_key_label(key, keys)}': invalid path.")
+
+def _descend_existing(dct, keys : tuple):
+    """
+    Walks all but the last parsed segment without creating anything.
+    Returns _throw_error if a segment is missing.
+    """
+    for k, idx in keys[:-1]:
+        if (type(dct) is dict or isinstance(dct, dict)) and k in dct:
+            dct = dct[k]
+        elif (type(dct) is list or isinstance(dct, list)) and idx is not None and idx < len(dct):
+            dct = dct[idx]
+        else:
+            return _throw_error
+    return dct
 
 def deep_pop(dct, key: str, separator: str = '/', default=_throw_error):
     """
@@ -81,31 +205,29 @@ def deep_pop(dct, key: str, separator: str = '/', default=_throw_error):
     Raises:
         KeyError: If the key path does not exist and no default is provided.
     """
-    keys = key.split(separator)
-    for k in keys[:-1]:
-        if isinstance(dct, dict) and k in dct:
-            dct = dct[k]
-        elif isinstance(dct, list) and k.isdigit() and 0 <= int(k) < len(dct):
-            dct = dct[int(k)]
-        else:
-            if default is _throw_error:
-                raise KeyError(f"Key '{key}' not found for pop.")
-            return default
-    last = keys[-1]
-    if isinstance(dct, dict):
-        if last in dct:
-            return dct.pop(last)
-        elif default is not _throw_error:
-            return default
-        else:
+    if (type(dct) is dict or isinstance(dct, dict)) and separator not in key:
+        value = dct.pop(key, _throw_error)
+        if value is not _throw_error:
+            return value
+        if default is _throw_error:
             raise KeyError(f"Key '{key}' not found for pop.")
-    elif isinstance(dct, list) and last.isdigit() and 0 <= int(last) < len(dct):
-        return dct.pop(int(last))
+        return default
+    return _deep_pop_parts(dct, _parse_path(key, separator), key, default)
+
+def _deep_pop_parts(dct, keys : tuple, key : str, default = _throw_error):
+    """
+    deep_pop on an already parsed key path; key is only used for error messages.
+    """
+    dct = _descend_existing(dct, keys)
+    last, idx = keys[-1]
+    if (type(dct) is dict or isinstance(dct, dict)) and last in dct:
+        return dct.pop(last)
+    elif (type(dct) is list or isinstance(dct, list)) and idx is not None and idx < len(dct):
+        return dct.pop(idx)
+    elif default is not _throw_error:
+        return default
     else:
-        if default is not _throw_error:
-            return default
-        else:
-            raise KeyError(f"Key '{key}' not found for pop.")
+        raise KeyError(f"Key '{_key_label(key, keys)}' not found for pop.")
 
 def deep_setdefault(dct, key: str, default_value, separator: str = '/'):
     """
@@ -118,34 +240,19 @@ def deep_setdefault(dct, key: str, default_value, separator: str = '/'):
     Returns:
         The value at the specified key path after setdefault.
     """
-    keys = key.split(separator)
-    for k in keys[:-1]:
-        if isinstance(dct, dict):
-            if k not in dct or not isinstance(dct[k], (dict, list)):
-                if k.isdigit():
-                    dct[k] = []
-                else:
-                    dct[k] = {}
-            dct = dct[k]
-        elif isinstance(dct, list) and k.isdigit():
-            index = int(k)
-            if len(dct) <= index:
-                raise IndexError(f"Index {index} out of range for list at '{key}'.")
-            if not isinstance(dct[index], dict):
-                dct[index] = {}
-            dct = dct[index]
-        else:
-            raise KeyError(f"Cannot setdefault at '{key}': invalid path.")
-    last = keys[-1]
-    if isinstance(dct, dict):
+    if (type(dct) is dict or isinstance(dct, dict)) and separator not in key:
+        return dct.setdefault(key, default_value)
+    keys = _parse_path(key, separator)
+    dct = _descend_create(dct, keys, key, "setdefault")
+    last, idx = keys[-1]
+    if (type(dct) is dict or isinstance(dct, dict)):
         return dct.setdefault(last, default_value)
-    elif isinstance(dct, list) and last.isdigit():
-        index = int(last)
-        if len(dct) <= index:
-            raise IndexError(f"Index {index} out of range for list at '{key}'.")
-        if dct[index] is None:
-            dct[index] = default_value
-        return dct[index]
+    elif (type(dct) is list or isinstance(dct, list)) and idx is not None:
+        if len(dct) <= idx:
+            raise IndexError(f"Index {idx} out of range for list at '{key}'.")
+        if dct[idx] is None:
+            dct[idx] = default_value
+        return dct[idx]
     else:
         raise KeyError(f"Cannot setdefault at '{key}': invalid path.")
 
@@ -159,26 +266,57 @@ def deep_delete(dct, key: str, separator: str = '/'):
     Raises:
         KeyError: If the key path does not exist.
     """
-    keys = key.split(separator)
-    for k in keys[:-1]:
-        if isinstance(dct, dict) and k in dct:
-            dct = dct[k]
-        elif isinstance(dct, list) and k.isdigit() and 0 <= int(k) < len(dct):
-            dct = dct[int(k)]
-        else:
-            raise KeyError(f"Key '{key}' not found for delete.")
-    
-    last = keys[-1]
-    if isinstance(dct, dict):
-        if last in dct:
-            del dct[last]
-        else:
+    if (type(dct) is dict or isinstance(dct, dict)) and separator not in key:
+        if key not in dct:
             raise KeyError(f"Key '{key}' not found for delete.")
-    elif isinstance(dct, list) and last.isdigit() and 0 <= int(last) < len(dct):
-        del dct[int(last)]
+        del dct[key]
+        return
+    keys = _parse_path(key, separator)
+    dct = _descend_existing(dct, keys)
+    last, idx = keys[-1]
+    if (type(dct) is dict or isinstance(dct, dict)) and last in dct:
+        del dct[last]
+    elif (type(dct) is list or isinstance(dct, list)) and idx is not None and idx < len(dct):
+        del dct[idx]
     else:
         raise KeyError(f"Key '{key}' not found for delete.")
 
+def deep_move(dct, src: str, dst: str, separator: str = '/', value = _throw_error):
+    """
+    Moves a value from one key path to another in a nested dict or list.
+    Same result as deep_set at dst followed by deep_pop at src, but the shared
+    prefix of both paths is walked only once.
+    Args:
+        dct: The dictionary or list to modify.
+        src: The key path to move from (e.g., 'a/b/old').
+        dst: The key path to move to (e.g., 'a/b/new').
+        separator: Separator for splitting the key paths (default: '/').
+        value: If given, stored at dst instead of the value found at src;
+            src is then removed only if it exists.
+    Returns:
+        The value stored at dst.
+    Raises:
+        KeyError: If src does not exist and no value is given, or dst is an invalid path.
+        IndexError: If a list index on the dst path is out of range.
+    """
+    src_keys = _parse_path(src, separator)
+    dst_keys = _parse_path(dst, separator)
+    if value is _throw_error:
+        value = _deep_get_parts(dct, src_keys, src)
+
+    # shared prefix, excluding the last segment of either path
+    limit = min(len(src_keys), len(dst_keys)) - 1
+    i = 0
+    while i < limit and src_keys[i] == dst_keys[i]:
+        i += 1
+
+    if i:
+        # walk (creating as deep_set would) to the common parent once
+        dct = _descend_create(dct, dst_keys[:i + 1], dst, "set value")
+    _deep_set_parts(dct, dst_keys[i:], dst, value)
+    _deep_pop_parts(dct, src_keys[i:], src, None)
+    return value
+
 def deep_get_2(dct, key : str, separator : str = '/', default = _throw_error):
     """
     Recursively retrieves a value from a nested dict or list of dicts using a key path.
@@ -194,40 +332,35 @@ def deep_get_2(dct, key : str, separator : str = '/', default = _throw_error):
     Raises:
         KeyError: If the key path does not exist and no default is provided.
     """
-    keys = key.split(separator)
-    def _get(obj, keys):
-        if not keys:
-            return obj
-        k = keys[0]
-        rest = keys[1:]
-        if isinstance(obj, dict):
-            if k in obj:
-                return _get(obj[k], rest)
-            else:
-                if default is _throw_error:
-                    raise KeyError(f"Key '{key}' not found in the dictionary.")
-                return default
-        elif isinstance(obj, list):
-            results = []
-            for item in obj:
-                if isinstance(item, dict):
-                    val = _get(item, keys)
-                    if val is default and default is not _throw_error:
-                        results.append(default)
-                    elif val is default:
-                        # If any mapping is missing and no default, fail the whole function
-                        raise KeyError(f"Key '{key}' not found in one or more mappings.")
-                    else:
-                        results.append(val)
-                else:
-                    # If any item is not a dict, fail the whole function
-                    raise KeyError(f"Key '{key}' not found in one or more mappings.")
-            return results
-        else:
+    keys = _split_path(key, separator)
+    n = len(keys)
+    # explicit work-stack of (obj, key index, output list, output slot, came from list)
+    root = [None]
+    stack = [(dct, 0, root, 0, False)]
+    while stack:
+        obj, i, out, slot, from_list = stack.pop()
+        if from_list and not isinstance(obj, dict):
+            # If any item is not a dict, fail the whole function
+            raise KeyError(f"Key '{key}' not found in one or more mappings.")
+        while i < n:
+            if isinstance(obj, dict):
+                if keys[i] in obj:
+                    obj = obj[keys[i]]
+                    i += 1
+                    continue
+            elif isinstance(obj, list):
+                # fan out: each item resolves the remaining path into its own slot
+                results = [None] * len(obj)
+                for j in range(len(obj) - 1, -1, -1):
+                    stack.append((obj[j], i, results, j, True))
+                obj = results
+                break
             if default is _throw_error:
                 raise KeyError(f"Key '{key}' not found in the dictionary.")
-            return default
-    return _get(dct, keys)
+            obj = default
+            break
+        out[slot] = obj
+    return root[0]
     
 def merge_dict(
         *dicts, 
@@ -245,6 +378,7 @@ def merge_dict(
     
     d1 = dicts[0]
     assert isinstance(d1, (dict, list)), "First argument must be a dictionary or list."
+    merge_list = _list_merge_func(list_merge_method)
 
     current = 0
     while current < len(dicts) - 1:
@@ -256,63 +390,93 @@ def merge_dict(
             raise TypeError("All inputs must be of the same type (dict or list).")
 
         if isinstance(d1, dict):
-            _merge_dict(d1, d2, list_merge_method, dict_merge_method)
+            _merge_dict(d1, d2, merge_list, dict_merge_method)
         else:
-            d1 = _merge_list(d1, d2, list_merge_method, dict_merge_method)
+            d1 = merge_list(d1, d2)
 
         current += 1
 
     return d1
 
-def _merge_dict(d1 : dict, d2 : dict, list_merge_method, dict_merge_method):
+def _merge_dict(d1 : dict, d2 : dict, merge_list, dict_merge_method):
     """
     Merges two dictionaries recursively.
+    merge_list is the list merge function resolved from list_merge_method.
     """
+    # local aliases, looked up once instead of per key
+    _isinstance = isinstance
+    _dict = dict
+    _list = list
     for key, value in d2.items():
-        if key in d1:
-            if isinstance(d1[key], dict) and isinstance(value, dict):
-                d1[key] = _merge_dict(d1[key], value, list_merge_method, dict_merge_method)
-            elif isinstance(d1[key], list) and isinstance(value, list):
-                d1[key] = _merge_list(d1[key], value, list_merge_method, dict_merge_method)
-            elif dict_merge_method == "merge":
-                # Accumulate all values as a list, regardless of type
-                if not isinstance(d1[key], list):
-                    d1[key] = [d1[key]]
-                d1[key].append(value)
-            elif d1[key] is None and dict_merge_method == "replace":
-                d1[key] = value
-            elif type(d1[key]) is not type(value):
-                raise TypeError(f"Type mismatch for key '{key}': {type(d1[key])} vs {type(value)}")
-            elif dict_merge_method == "replace":
-                d1[key] = value
-            elif dict_merge_method == "keep":
-                continue
-        else:
+        cur = d1.get(key, _throw_error)
+        if cur is _throw_error:
+            d1[key] = value
+            continue
+        # exact type check first, isinstance only for subclasses
+        cur_type = type(cur)
+        value_type = type(value)
+        cur_is_dict = cur_type is _dict or _isinstance(cur, _dict)
+        cur_is_list = not cur_is_dict and (cur_type is _list or _isinstance(cur, _list))
+        if cur_is_dict and (value_type is _dict or _isinstance(value, _dict)):
+            d1[key] = _merge_dict(cur, value, merge_list, dict_merge_method)
+        elif cur_is_list and (value_type is _list or _isinstance(value, _list)):
+            d1[key] = merge_list(cur, value)
+        elif dict_merge_method == "merge":
+            # Accumulate all values as a list, regardless of type
+            if not cur_is_list:
+                cur = d1[key] = [cur]
+            cur.append(value)
+        elif cur is None and dict_merge_method == "replace":
             d1[key] = value
+        elif cur_type is not value_type:
+            raise TypeError(f"Type mismatch for key '{key}': {cur_type} vs {value_type}")
+        elif dict_merge_method == "replace":
+            d1[key] = value
+        elif dict_merge_method == "keep":
+            continue
     return d1
 
-def _merge_list(d1 : list, d2 : list, list_merge_method, dict_merge_method):
-    """
-    Merges two lists.
-    """
-    if list_merge_method == "extend":
-        return d1 + d2
-    elif list_merge_method == "replace":
-        return d2
-    elif list_merge_method == "keep":
-        return d1
-    elif list_merge_method == "merge":
-        merged = []
-        for item1, item2 in zip(d1, d2):
-            if isinstance(item1, dict) and isinstance(item2, dict):
-                # Merge dicts as a pair, not in-place
-                merged.append([item1, item2])
-            elif isinstance(item1, list) and isinstance(item2, list):
-                merged.append([item1, item2])
-            elif type(item1) is not type(item2):
-                raise TypeError(f"Type mismatch in list merge: {type(item1)} vs {type(item2)}")
-            else:
-                merged.append([item1, item2])
-        return merged
-    else:
-        raise ValueError(f"Unknown list merge method: {list_merge_method}")
\ No newline at end of file
+def _list_extend(d1 : list, d2 : list):
+    return d1 + d2
+
+def _list_replace(d1 : list, d2 : list):
+    return d2
+
+def _list_keep(d1 : list, d2 : list):
+    return d1
+
+def _list_merge(d1 : list, d2 : list):
+    """
+    Pairs items of two lists by position.
+    """
+    _type = type
+    merged = []
+    append = merged.append
+    for item1, item2 in zip(d1, d2):
+        # dicts and lists are paired as-is, not merged in-place; any other
+        # pair must share a type
+        if _type(item1) is not _type(item2) and not (
+            isinstance(item1, dict) and isinstance(item2, dict)
+            or isinstance(item1, list) and isinstance(item2, list)
+        ):
+            raise TypeError(f"Type mismatch in list merge: {_type(item1)} vs {_type(item2)}")
+        append([item1, item2])
+    return merged
+
+_LIST_MERGE_METHODS = {
+    "extend": _list_extend,
+    "replace": _list_replace,
+    "keep": _list_keep,
+    "merge": _list_merge,
+}
+
+def _list_merge_func(list_merge_method):
+    """
+    Resolves list_merge_method to its merge function once per merge_dict call.
+    An unknown method only raises once a list pair is actually merged.
+    """
+    func = _LIST_MERGE_METHODS.get(list_merge_method)
+    if func is None:
+        def func(d1 : list, d2 : list):
+            raise ValueError(f"Unknown list merge method: {list_merge_method}")
+    return func
@@ -1,3 +1,27 @@
+from functools import lru_cache, partial
+from operator import eq, methodcaller
+
+
+@lru_cache(maxsize=1024)
+def _compile_simple_match(pattern : str):
+    """
+    Builds a match predicate for a simple_match pattern, cached per pattern.
+    Raises ValueError if more than one '*' is present.
+    """
+    count = pattern.count("*")
+    if count == 0:
+        return partial(eq, pattern)
+    
+    if count > 1:
+        raise ValueError("Pattern can only contain one '*' wildcard.")
+    index = pattern.find("*")
+    if index == 0:
+        return methodcaller("endswith", pattern[1:])
+    elif index == len(pattern) - 1:
+        return methodcaller("startswith", pattern[:-1])
+    else:
+        prefix, suffix = pattern[:index], pattern[index + 1:]
+        return lambda value: value.startswith(prefix) and value.endswith(suffix)
 
 def simple_match(pattern : str, value : str) -> bool:
     """
@@ -13,19 +37,7 @@ def simple_match(pattern : str, value : str) -> bool:
     Returns:
         bool: True if value matches pattern, False otherwise.
     """
-    count = pattern.count("*")
-    if count == 0:
-        return pattern == value
-    
-    if count > 1:
-        raise ValueError("Pattern can only contain one '*' wildcard.")
-    index = pattern.find("*")
-    if index == 0:
-        return value.endswith(pattern[1:])
-    elif index == len(pattern) - 1:
-        return value.startswith(pattern[:-1])
-    else:
-        return value.startswith(pattern[:index]) and value.endswith(pattern[index + 1:])
+    return _compile_simple_match(pattern)(value)
     
 def rreplace(s: str, old: str, new: str, occurrence):
     """
@@ -54,31 +66,72 @@ def rreplace(s: str, old: str, new: str, occurrence):
     return new.join(parts)
 
 
+_INDEX_THRESHOLD = 16
+
+@lru_cache(maxsize=64)
+def _index_patterns(patterns : tuple):
+    """
+    Partitions patterns into exact, prefix, suffix and split classes.
+    Returns None if any pattern is invalid so the caller can fall back
+    to the ordered scan (and raise at the same point it always did).
+    """
+    exact, prefixes, suffixes, split = set(), set(), set(), []
+    for pattern in patterns:
+        count = pattern.count("*")
+        if count == 0:
+            exact.add(pattern)
+        elif count > 1:
+            return None
+        elif pattern[-1] == "*":
+            prefixes.add(pattern[:-1])
+        elif pattern[0] == "*":
+            suffixes.add(pattern[1:])
+        else:
+            split.append(_compile_simple_match(pattern))
+    return (
+        frozenset(exact),
+        frozenset(prefixes), tuple(sorted({len(p) for p in prefixes})),
+        frozenset(suffixes), tuple(sorted({len(p) for p in suffixes})),
+        tuple(split),
+    )
+
+def _indexed_match(index, value : str) -> bool:
+    exact, prefixes, prefix_lengths, suffixes, suffix_lengths, split = index
+    if value in exact:
+        return True
+    size = len(value)
+    for n in prefix_lengths:
+        if n > size:
+            break
+        if value[:n] in prefixes:
+            return True
+    for n in suffix_lengths:
+        if n > size:
+            break
+        if value[size - n:] in suffixes:
+            return True
+    return any(match(value) for match in split)
+
 def simple_matches(values : list[str], patterns : list[str], useCache : bool = True) -> bool:
     """
     Checks if any value in a list matches any pattern in another list using simple_match.
-    Caches results for efficiency if useCache is True.
+    Patterns are compiled once through the shared simple_match cache.
     
     Args:
         values (list[str]): List of strings to check.
         patterns (list[str]): List of patterns to match against.
-        useCache (bool): Whether to cache results for efficiency.
+        useCache (bool): Kept for backwards compatibility; has no effect.
         
     Returns:
         bool: True if any value matches any pattern, False otherwise.
     """
-    cache = {}
-    
-    for value in values:
-        for pattern in patterns:
-            key = (value, pattern)
-            if useCache and key in cache:
-                if cache[key]:
-                    return True
-            else:
-                match_result = simple_match(pattern, value)
-                if useCache:
-                    cache[key] = match_result
-                if match_result:
-                    return True
-    return False
\ No newline at end of file
+    if len(patterns) >= _INDEX_THRESHOLD:
+        index = _index_patterns(tuple(patterns))
+        if index is not None:
+            # the index slices values, anything else takes the per-pattern matchers
+            return any(
+                _indexed_match(index, value) if isinstance(value, str)
+                else any(_compile_simple_match(pattern)(value) for pattern in patterns)
+                for value in values
+            )
+    return any(_compile_simple_match(pattern)(value) for value in values for pattern in patterns)
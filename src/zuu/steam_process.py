@@ -4,33 +4,61 @@ This module provides functions to check, manage, and interact with Steam process
 on the system using the psutil library.
 """
 
+import time
+
 import psutil
 
+_cache = {'pid': None, 'ts': 0.0}
+
+def _get_steam(ttl: float = 2.0) -> psutil.Process | None:
+    """Find the Steam process, reusing the last seen PID while it is fresh.
+    
+    Within ``ttl`` seconds of the last scan, the cached PID is opened directly
+    and revalidated by name; only on a miss are all processes scanned.
+    
+    Args:
+        ttl (float): Seconds a cached PID is trusted before rescanning.
+    
+    Returns:
+        psutil.Process | None: The Steam process object if found, None otherwise.
+    """
+    pid = _cache['pid']
+    if pid is not None and time.monotonic() - _cache['ts'] < ttl:
+        try:
+            process = psutil.Process(pid)
+            if process.name() == 'steam.exe':
+                return process
+        except psutil.Error:
+            pass
+
+    for process in psutil.process_iter(['name']):
+        if process.info['name'] == 'steam.exe':
+            _cache['pid'] = process.pid
+            _cache['ts'] = time.monotonic()
+            return process
+
+    _cache['pid'] = None
+    return None
+
 def steam_is_running() -> bool:
     """Check if Steam is currently running.
     
-    Iterates through all running processes to determine if steam.exe is active.
+    Looks up steam.exe through the cached process lookup.
     
     Returns:
         bool: True if Steam is running, False otherwise.
     """
-    for process in psutil.process_iter(['name']):
-        if process.info['name'] == 'steam.exe':
-            return True
-    return False 
+    return _get_steam() is not None
 
 def steam_process() -> psutil.Process | None:
     """Get the Steam process object if it's running.
     
-    Searches through all running processes to find the steam.exe process.
+    Looks up steam.exe through the cached process lookup.
     
     Returns:
         psutil.Process | None: The Steam process object if found, None otherwise.
     """
-    for process in psutil.process_iter(['name']):
-        if process.info['name'] == 'steam.exe':
-            return process
-    return None
+    return _get_steam()
 
 def kill_steam() -> None:
     """Terminate the Steam process if it's running.
@@ -1,34 +1,172 @@
 import os
+import sys
+import json
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from zuu.dict_patterns import extract_nested_keys
-from zuu.json_io import read_json, write_json
+from zuu.json_io import write_json
 from zuu.diffdict import DiffDict
-from zuu.simple_dict import deep_get, deep_set, deep_pop
+from zuu.simple_dict import deep_move, parse_path, deep_get_parts, deep_set_parts, deep_pop_parts
 import copy
 
 
+def _is_under(key: str, roots, separator: str) -> bool:
+    """Whether key lies strictly below one of roots"""
+    while separator in key:
+        key = key.rpartition(separator)[0]
+        if key in roots:
+            return True
+    return False
+
+def _own_path(root, parts, copied: dict):
+    """
+    Shallow-copy root and the containers below it down to the parent of parts,
+    unless already copied, so a write at parts leaves the original untouched.
+    copied maps id -> copy and keeps the copies alive. Returns the root copy.
+    """
+    if id(root) not in copied:
+        root = root.copy()
+        copied[id(root)] = root
+    node = root
+    for k, idx in parts[:-1]:
+        if isinstance(node, dict):
+            slot = k
+            child = node.get(k)
+        elif isinstance(node, list) and idx is not None and idx < len(node):
+            slot = idx
+            child = node[idx]
+        else:
+            break
+        if not isinstance(child, (dict, list)):
+            break
+        if id(child) not in copied:
+            child = node[slot] = child.copy()
+            copied[id(child)] = child
+        node = child
+    return root
+
+def _iter_json(folder: str):
+    """Yield .json file paths under folder in os.walk order, without following directory symlinks"""
+    stack = [folder]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                # name screen first, the stat behind is_dir() only runs for .json entries
+                elif entry.name.endswith('.json') and not entry.is_dir():
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
 class SyncDictMeta(type):
-    _fileCache = {}
+    _fileCache = OrderedDict()
     _fileModifiedStamp = {}
+    _fileFingerprint = {}
+    _fileKeys = {}
     _maxSize = 256
+    _maxBytes = 64 * 1024 * 1024  # budget in source file bytes
 
-    def _getCacheFile(self, path: str):
-        recordedStamp = self._fileModifiedStamp.get(path)
-        if (
-            recordedStamp is not None
-            and path in self._fileCache
-            and os.path.getmtime(path) == recordedStamp
+    def set_cache_budget(self, max_bytes: int):
+        """Set the byte budget of the shared file cache and trim it to fit"""
+        self._maxBytes = max_bytes
+        self._evictCacheFiles()
+
+    def _evictCacheFiles(self):
+        """Evict least recently used files until both the entry cap and byte budget hold"""
+        # fingerprint[0] is the file size, so the footprint needs no object walk
+        total = sum(fingerprint[0] for fingerprint in self._fileFingerprint.values())
+        while len(self._fileCache) > self._maxSize or (
+            len(self._fileCache) > 1 and total > self._maxBytes
         ):
-            return self._fileCache.get(path)
+            evicted = next(iter(self._fileCache))
+            fingerprint = self._fileFingerprint.get(evicted)
+            if fingerprint is not None:
+                total -= fingerprint[0]
+            self._dropCacheFile(evicted)
 
-        raw = read_json(path)
-        self._fileCache[path] = raw
-        self._fileModifiedStamp[path] = os.path.getmtime(path)
+    def _dropCacheFile(self, path: str):
+        self._fileCache.pop(path, None)
+        self._fileModifiedStamp.pop(path, None)
+        self._fileFingerprint.pop(path, None)
+        self._fileKeys.pop(path, None)
+
+    def _getCacheFile(self, path: str):
+        try:
+            # nanosecond stamps, so quick successive saves do not look unchanged
+            st = os.stat(path)
+        except OSError:
+            # gone or unreadable: never serve the stale entry afterwards
+            self._dropCacheFile(path)
+            raise
+        mtime = st.st_mtime_ns
+        cached = path in self._fileCache
+        if cached and self._fileModifiedStamp.get(path) == mtime:
+            self._fileCache.move_to_end(path)
+            return self._fileCache[path]
+
+        try:
+            with open(path, "rb") as f:
+                # sized from the stat above, so read() does not fstat again;
+                # the extra byte catches a file that grew in between
+                data = f.read(st.st_size + 1)
+                if len(data) > st.st_size:
+                    data += f.read()
+        except OSError:
+            self._dropCacheFile(path)
+            raise
+        fingerprint = (len(data), hashlib.blake2b(data, digest_size=16).digest())
+
+        # touched but unchanged content (formatters, checkouts): skip the reparse
+        if cached and self._fileFingerprint.get(path) == fingerprint:
+            self._fileModifiedStamp[path] = mtime
+            self._fileCache.move_to_end(path)
+            return self._fileCache[path]
 
-        while len(self._fileCache) > self._maxSize:
-            self._fileCache.popitem()
+        raw = json.loads(data.decode("utf-8"))
+        self._fileCache[path] = raw
+        self._fileCache.move_to_end(path)
+        self._fileModifiedStamp[path] = mtime
+        self._fileFingerprint[path] = fingerprint
 
+        self._evictCacheFiles()
         return raw
 
+    def _getCacheFileKeys(self, path: str, separator: str) -> frozenset:
+        """Nested key set of a cached file, reused until the file is reparsed"""
+        data = self._getCacheFile(path)
+        entry = self._fileKeys.get(path)
+        if entry is not None and entry[0] is data and entry[1] == separator:
+            return entry[2]
+        # interned so files sharing a schema share one str object per path
+        keys = frozenset(map(sys.intern, extract_nested_keys(data, separator)))
+        self._fileKeys[path] = (data, separator, keys)
+        return keys
+
+    def _matchesFileKeys(self, path: str, separator: str, base: frozenset) -> bool:
+        """Whether a file's nested key set equals base, bailing on the first foreign key"""
+        data = self._getCacheFile(path)
+        entry = self._fileKeys.get(path)
+        if entry is not None and entry[0] is data and entry[1] == separator:
+            return entry[2] == base
+
+        # distinct keys are counted, a path can repeat when keys contain the separator
+        seen = set()
+        for key in extract_nested_keys(data, separator):
+            if key not in base:
+                return False
+            seen.add(key)
+        if len(seen) != len(base):
+            return False
+        # equal key sets: share the base frozenset instead of building a copy
+        self._fileKeys[path] = (data, separator, base)
+        return True
+
 class SyncDict(metaclass=SyncDictMeta):
     def __init__(self, path: str, separator: str = "/"):
         assert os.path.exists(path), f"Base path '{path}' does not exist"
@@ -36,103 +174,210 @@ class SyncDict(metaclass=SyncDictMeta):
         self.__separator = separator
         self.__desynced_list = []
         self.__watch_list = []
+        self.__watch_set = set()  # mirrors __watch_list for O(1) membership
+        self.__base_keys = None
+        self.__base_held_keys = frozenset()  # part of __base_keys below held containers
+        self.__dirty = set()  # key paths written or handed out since the last monitor()
+        self.__held = {}  # key path -> container handed out or stored by the caller
         
         # Initialize DiffDict with the base file data
         base_data = self.__class__._getCacheFile(self.__path)
-        self.__diffdict = DiffDict(data=copy.deepcopy(base_data), separator=separator)
+        # shares the cached base; DiffDict copies only what gets written or handed out
+        self.__diffdict = DiffDict(data=base_data, separator=separator, copyOnWrite=True)
         
         # Store baseline structure for change detection
         self.__baseline_keysums = self.__diffdict.update_keysums()
+        self.__baseline_subtrees = self.__diffdict.subtree_keysums()
 
     def add_watch(self, path: str):
         assert os.path.exists(path), f"Path '{path}' does not exist"
-        path = os.path.abspath(path)
-        if path in self.__watch_list or path == self.__path:
+        self._add_watch(os.path.abspath(path), self._base_keys())
+
+    def _add_watch(self, path: str, base_keys: frozenset):
+        """add_watch for a path that is already absolute and normalized"""
+        if path in self.__watch_set or path == self.__path:
             return
             
-        watched_data = self.__class__._getCacheFile(path)
-        watched_keys = set(extract_nested_keys(watched_data, self.__separator))
-        
         # Compare with current base structure
-        base_keys = set(extract_nested_keys(self.__diffdict.dataref, self.__separator))
-        
-        if base_keys != watched_keys:
+        if not self.__class__._matchesFileKeys(path, self.__separator, base_keys):
             self.__desynced_list.append(path)
         else:
             self.__watch_list.append(path)
+            self.__watch_set.add(path)
 
     def add_watchfolder(self, folder: str):
         assert os.path.exists(folder), f"Folder '{folder}' does not exist"
         assert os.path.isdir(folder), f"Path '{folder}' is not a folder"
         folder = os.path.abspath(folder)
         
-        for root, dirs, files in os.walk(folder):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                if file_path.endswith('.json'):  # Only process JSON files
-                    try:
-                        self.add_watch(file_path)
-                    except (AssertionError, Exception):
-                        # Skip files that can't be processed
-                        pass
+        # scanned paths are already absolute; a vanished file fails in _getCacheFile
+        base_keys = self._base_keys()
+        for file_path in _iter_json(folder):
+            try:
+                self._add_watch(file_path, base_keys)
+            except Exception:
+                # Skip files that can't be processed
+                pass
+
+    def _base_keys(self) -> frozenset:
+        """Nested key set of the base data, cached until a write; only held containers are rescanned"""
+        held_keys = self._held_keys()
+        if self.__base_keys is None:
+            self.__base_keys = frozenset(
+                map(sys.intern, extract_nested_keys(self.__diffdict.dataref, self.__separator))
+            )
+        elif held_keys != self.__base_held_keys:
+            # a held container was edited in place since the key set was built
+            self.__base_keys = (self.__base_keys - self.__base_held_keys) | held_keys
+        self.__base_held_keys = held_keys
+        return self.__base_keys
+
+    def _held_keys(self) -> frozenset:
+        """Nested keys below the containers the caller holds"""
+        data = self.__diffdict.dataref
+        separator = self.__separator
+        keys = set()
+        for path in self.__held:
+            value = deep_get_parts(data, parse_path(path, separator), None)
+            if isinstance(value, (dict, list)):
+                keys.update(extract_nested_keys(value, separator, path))
+        return frozenset(map(sys.intern, keys))
+
+    def _prune_held(self, key: str = None):
+        """Forget held containers, at or below key if given, that are no longer in the data"""
+        data = self.__diffdict.dataref
+        separator = self.__separator
+        prefix = None if key is None else key + separator
+        for path, container in list(self.__held.items()):
+            if prefix is not None and path != key and not path.startswith(prefix):
+                continue
+            if deep_get_parts(data, parse_path(path, separator), None) is not container:
+                del self.__held[path]
 
     # Dict-like interface - just operates on source data
     def __getitem__(self, key):
-        return self.__diffdict[key]
+        value = self.__diffdict[key]
+        if isinstance(value, (dict, list)):
+            # a live container may be edited in place at any later point
+            self.__dirty.add(key)
+            if self.__held.get(key) is not value:
+                # its keys are rescanned by _base_keys from now on, so the cached
+                # key set has to be rebuilt once with it held
+                self.__held[key] = value
+                self.__base_keys = None
+        return value
         
     def __setitem__(self, key, value):
-        self.__diffdict[key] = value
+        # marked before the write: a failing write may already have created intermediates
+        self.__base_keys = None
+        self.__dirty.add(key)
+        try:
+            self.__diffdict[key] = value
+        finally:
+            # containers the write detached are no longer watched
+            self._prune_held(key)
+        if isinstance(value, (dict, list)):
+            # the caller keeps a reference to the container it stored
+            self.__held[key] = value
         
     def __delitem__(self, key):
-        del self.__diffdict[key]
+        self.__base_keys = None
+        self.__dirty.add(key)
+        try:
+            del self.__diffdict[key]
+        finally:
+            self._prune_held(key)
     
     def __contains__(self, key):
         return key in self.__diffdict
 
     def monitor(self):
         """Track structural changes and detect moves using checksums"""
-        current_keysums = self.__diffdict.update_keysums()
-        
-        # Compare baseline vs current to detect structural changes
-        baseline_keys = set(self.__baseline_keysums.keys())
-        current_keys = set(current_keysums.keys())
+        # only paths touched since the last call are rehashed; containers the
+        # caller holds can be edited in place at any time, so they always are
+        dirty = self.__dirty
+        dirty.update(self.__held)
+        self.__dirty = set()
+        # containers edited away through a held parent are no longer there to watch
+        self._prune_held()
+        current_keysums = self.__diffdict.update_keysums(dirty_paths=dirty, previous=self.__baseline_keysums)
+        current_subtrees = self.__diffdict.subtree_keysums(dirty_paths=dirty, previous=self.__baseline_subtrees)
+        self.__base_keys = None
+        separator = self.__separator
         
-        added_keys = current_keys - baseline_keys
-        removed_keys = baseline_keys - current_keys
+        # Relocated subtrees first: a whole dict whose digest now lives at a new path
+        # is one move, instead of one move per leaf below it
+        baseline_subtrees = self.__baseline_subtrees
+        removed_subtrees = baseline_subtrees.keys() - current_subtrees.keys()
+        added_subtrees = current_subtrees.keys() - baseline_subtrees.keys()
+        current_subtree_to_key = {checksum: key for key, checksum in current_subtrees.items()}
+        removed_subtree_to_key = {baseline_subtrees[key]: key for key in removed_subtrees}
+        subtree_moves = {
+            removed_subtree_to_key[checksum]: current_subtree_to_key[checksum]
+            for checksum in removed_subtree_to_key.keys() & current_subtree_to_key.keys()
+            if current_subtree_to_key[checksum] in added_subtrees
+        }
+        # a nested dict that moved along with its parent is covered by the parent's move
+        self.__moved_subtrees = {}
+        for removed_key, added_key in subtree_moves.items():
+            head = removed_key
+            while separator in head:
+                head = head.rpartition(separator)[0]
+                target = subtree_moves.get(head)
+                if target is not None and added_key == target + removed_key[len(head):]:
+                    break
+            else:
+                self.__moved_subtrees[removed_key] = added_key
+        moved_from = self.__moved_subtrees.keys()
+        moved_to = set(self.__moved_subtrees.values())
         
-        # Detect moves by matching checksums: same checksum at different key = move
-        self.__moves = {}  # removed_key -> added_key
-        remaining_added = set(added_keys)
-        remaining_removed = set(removed_keys)
+        # Compare baseline vs current to detect structural changes, leaving out
+        # leaves that travel with a moved subtree
+        baseline_keysums = self.__baseline_keysums
+        added_keys = {
+            key for key in current_keysums.keys() - baseline_keysums.keys()
+            if not _is_under(key, moved_to, separator)
+        }
+        removed_keys = {
+            key for key in baseline_keysums.keys() - current_keysums.keys()
+            if not _is_under(key, moved_from, separator)
+        }
         
-        # Build reverse lookup: checksum -> key for current keysums
+        # Detect moves by matching checksums: same checksum at different key = move.
+        # Inverted indexes: checksum -> key for the current data and the removed keys
         current_checksum_to_key = {checksum: key for key, checksum in current_keysums.items()}
+        removed_checksum_to_key = {baseline_keysums[key]: key for key in removed_keys}
         
-        for removed_key in removed_keys:
-            removed_checksum = self.__baseline_keysums[removed_key]
-            
-            # Look for the same checksum in current keysums at a different location
-            if removed_checksum in current_checksum_to_key:
-                added_key = current_checksum_to_key[removed_checksum]
-                
-                # Verify this added_key is actually new (not just unchanged)
-                if added_key in remaining_added:
-                    # This is a move: same content, different location
-                    self.__moves[removed_key] = added_key
-                    remaining_added.discard(added_key)
-                    remaining_removed.discard(removed_key)
+        # removed_key -> added_key, only where the checksum now lives at a new key
+        leaf_moves = {
+            removed_checksum_to_key[checksum]: current_checksum_to_key[checksum]
+            for checksum in removed_checksum_to_key.keys() & current_checksum_to_key.keys()
+            if current_checksum_to_key[checksum] in added_keys
+        }
         
         # What's left are true additions and removals
-        self.__true_additions = remaining_added
-        self.__true_removals = remaining_removed
+        self.__true_additions = added_keys - set(leaf_moves.values())
+        self.__true_removals = removed_keys - leaf_moves.keys()
+        # subtree moves are applied before leaf moves
+        self.__moves = {**self.__moved_subtrees, **leaf_moves}
+        
+        # Parse each key path once here instead of once per watched file in applyChanges
+        self.__moves_parts = [
+            (removed_key, added_key, parse_path(removed_key, separator), parse_path(added_key, separator))
+            for removed_key, added_key in self.__moves.items()
+        ]
+        self.__additions_parts = [parse_path(added_key, separator) for added_key in self.__true_additions]
+        self.__removals_parts = [parse_path(removed_key, separator) for removed_key in self.__true_removals]
         
         # Update baseline for next comparison
         self.__baseline_keysums = current_keysums
+        self.__baseline_subtrees = current_subtrees
         
         return {
             'added': self.__true_additions,
             'removed': self.__true_removals,
-            'moved': self.__moves
+            'moved': self.__moves,
+            'moved_subtrees': self.__moved_subtrees
         }
 
     def applyChanges(self):
@@ -140,68 +385,108 @@ class SyncDict(metaclass=SyncDictMeta):
         if not hasattr(self, '_SyncDict__moves'):
             return  # No changes detected
             
-        for watch_path in self.__watch_list[:]:  # Copy to avoid modification during iteration
+        # Restructure each file in memory first; reading the shared cache stays serial
+        pending = []  # (watch_path, watched_data or None if restructuring failed)
+        for watch_path in self.__watch_list:
             try:
-                # Load current watched file data
+                # The cached parse may be another SyncDict's base, so it is restructured
+                # copy-on-write: only containers on a written path are copied
                 watched_data = self.__class__._getCacheFile(watch_path)
-                original_data = copy.deepcopy(watched_data)
+                copied = {}
+                
+                # Snapshot only what is read back below, before anything is written.
+                # Moved containers are copied since later moves may pop from them.
+                moved_values = {}
+                for removed_key, _, parts, _ in self.__moves_parts:
+                    value = deep_get_parts(watched_data, parts, None)
+                    if isinstance(value, (dict, list)):
+                        value = copy.deepcopy(value)
+                    moved_values[removed_key] = value
+                missing_parts = [
+                    parts for parts in self.__additions_parts
+                    if deep_get_parts(watched_data, parts, None) is None
+                ]
                 
                 # Apply moves first (preserve translated content during restructuring)
-                for removed_key, added_key in self.__moves.items():
+                for removed_key, added_key, removed_parts, added_parts in self.__moves_parts:
                     # Get the translated value from the old location
-                    translated_value = deep_get(original_data, removed_key, self.__separator, default=None)
+                    translated_value = moved_values[removed_key]
                     if translated_value is not None:
-                        # Move the translated value to new location
-                        deep_set(watched_data, added_key, translated_value, self.__separator)
-                        # Remove from old location
-                        deep_pop(watched_data, removed_key, self.__separator, default=None)
+                        # Move the translated value to new location, removing the old one
+                        watched_data = _own_path(watched_data, removed_parts, copied)
+                        watched_data = _own_path(watched_data, added_parts, copied)
+                        deep_move(watched_data, removed_key, added_key, self.__separator, value=translated_value)
                 
                 # Apply true additions (new keys that didn't exist before)
-                for added_key in self.__true_additions:
-                    existing_value = deep_get(original_data, added_key, self.__separator, default=None)
-                    
-                    if existing_value is None:
-                        # New key - use base value as placeholder
-                        base_value = deep_get(self.__diffdict.dataref, added_key, self.__separator)
-                        deep_set(watched_data, added_key, base_value, self.__separator)
+                for parts in missing_parts:
+                    # New key - use base value as placeholder
+                    base_value = deep_get_parts(self.__diffdict.dataref, parts)
+                    watched_data = _own_path(watched_data, parts, copied)
+                    deep_set_parts(watched_data, parts, base_value)
                 
                 # Apply true removals (keys that were deleted, not moved)
-                for removed_key in self.__true_removals:
-                    deep_pop(watched_data, removed_key, self.__separator, default=None)
+                for parts in self.__removals_parts:
+                    watched_data = _own_path(watched_data, parts, copied)
+                    deep_pop_parts(watched_data, parts, None)
                 
                 # Clean up empty parent containers after removals
-                self._cleanup_empty_containers(watched_data)
-                
-                # Write back to file
-                write_json(watch_path, watched_data)
+                watched_data = self._cleanup_empty_containers(watched_data, copied)
+                pending.append((watch_path, watched_data))
                 
             except Exception:
+                pending.append((watch_path, None))
+        
+        # Write back to files; each file is independent, so the writes overlap in threads
+        writes = [(watch_path, data) for watch_path, data in pending if data is not None]
+        failed = set()
+        if len(writes) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(writes))) as executor:
+                futures = [(watch_path, executor.submit(write_json, watch_path, data)) for watch_path, data in writes]
+            failed.update(watch_path for watch_path, future in futures if future.exception() is not None)
+        else:
+            for watch_path, data in writes:
+                try:
+                    write_json(watch_path, data)
+                except Exception:
+                    failed.add(watch_path)
+        
+        for watch_path, data in pending:
+            if data is not None:
+                # written (or half-written): reparse from disk on the next read
+                self.__class__._dropCacheFile(watch_path)
+            if data is None or watch_path in failed:
                 # Move to desynced if operation fails
-                if watch_path in self.__watch_list:
+                if watch_path in self.__watch_set:
                     self.__watch_list.remove(watch_path)
+                    self.__watch_set.discard(watch_path)
                 if watch_path not in self.__desynced_list:
                     self.__desynced_list.append(watch_path)
 
-    def _cleanup_empty_containers(self, data):
-        """Remove empty containers after deletions"""
-        def _cleanup_recursive(obj, path_parts):
-            if not isinstance(obj, dict):
-                return False
-                
-            keys_to_remove = []
-            for key, value in obj.items():
-                if isinstance(value, dict):
-                    if not value:  # Empty dict
-                        keys_to_remove.append(key)
-                    elif _cleanup_recursive(value, path_parts + [key]):
-                        keys_to_remove.append(key)
-            
-            for key in keys_to_remove:
-                del obj[key]
-            
-            return len(obj) == 0
+    def _cleanup_empty_containers(self, data, copied: dict):
+        """Remove empty containers after deletions, copy-on-write like applyChanges; returns the root"""
+        if not isinstance(data, dict):
+            return data
         
-        _cleanup_recursive(data, [])
+        # Single post-order walk with an explicit stack: a child is removed once
+        # all of its own children have been visited and it ended up empty
+        shrunk = set()
+        stack = [((), data, False)]
+        while stack:
+            parts, obj, visited = stack.pop()
+            if visited:
+                if parts and (not obj or parts in shrunk):
+                    # a removed child may have emptied the copy rather than obj itself
+                    if not deep_get_parts(data, parts):
+                        data = _own_path(data, parts, copied)
+                        deep_pop_parts(data, parts)
+                        shrunk.add(parts[:-1])
+                continue
+            
+            stack.append((parts, obj, True))
+            for child_key, value in obj.items():
+                if isinstance(value, dict):
+                    stack.append((parts + ((child_key, None),), value, False))
+        return data
 
     def save(self):
         """Save changes to the base file"""
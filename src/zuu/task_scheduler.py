@@ -1,7 +1,43 @@
-import win32com.client
-import pythoncom
+import contextlib
 
-def create_everyday_task(task_name, command, start_time, repetition_interval=None, repetition_duration=None):
+@contextlib.contextmanager
+def scheduler_connection():
+    """
+    Open a single Task Scheduler connection to share across several calls.
+    Dispatch and Connect are slow COM round-trips, so batch work should pass
+    the yielded scheduler to each function instead of reconnecting per call.
+    COM is uninitialized on exit, so neither the scheduler nor any object
+    obtained from it may be kept past the with-block.
+    Yields:
+        The connected Schedule.Service object.
+    """
+    # pywin32 is heavy and Windows-only, import it on first use
+    import pythoncom
+    import win32com.client
+
+    pythoncom.CoInitialize()
+    scheduler = None
+    try:
+        scheduler = win32com.client.Dispatch('Schedule.Service')
+        scheduler.Connect()
+        yield scheduler
+    finally:
+        # release the proxy while COM is still initialized
+        del scheduler
+        pythoncom.CoUninitialize()
+
+def _with_scheduler(scheduler, work, *args):
+    """Run work(scheduler, *args) on the given connection, or on a temporary one."""
+    if scheduler is not None:
+        return work(scheduler, *args)
+    with scheduler_connection() as connection:
+        try:
+            # COM objects made by work are its locals, gone once it returns
+            return work(connection, *args)
+        finally:
+            del connection
+
+def create_everyday_task(task_name, command, start_time, repetition_interval=None, repetition_duration=None, scheduler=None):
     """
     Create a Windows scheduled task that runs every day at the specified time.
     Args:
@@ -10,10 +46,14 @@ def create_everyday_task(task_name, command, start_time, repetition_interval=Non
         start_time (str): Time in HH:MM format (24h).
         repetition_interval (str, optional): ISO 8601 duration string for repetition interval (e.g., "PT1H" for 1 hour).
         repetition_duration (str, optional): ISO 8601 duration string for how long to repeat the task (e.g., "PT8H" for 8 hours).
+        scheduler (optional): Connection from scheduler_connection() to reuse.
     """
-    pythoncom.CoInitialize()
-    scheduler = win32com.client.Dispatch('Schedule.Service')
-    scheduler.Connect()
+    _with_scheduler(
+        scheduler, _create_everyday_task,
+        task_name, command, start_time, repetition_interval, repetition_duration,
+    )
+
+def _create_everyday_task(scheduler, task_name, command, start_time, repetition_interval, repetition_duration):
     rootFolder = scheduler.GetFolder("\\")
     taskDef = scheduler.NewTask(0)
     taskDef.RegistrationInfo.Description = f"Run {command} every day at {start_time}"
@@ -35,16 +75,17 @@ def create_everyday_task(task_name, command, start_time, repetition_interval=Non
     action.Path = command
     rootFolder.RegisterTaskDefinition(task_name, taskDef, 6, None, None, 3)
 
-def create_onlogin_task(task_name, command, description="Run {command} on user logon"):
+def create_onlogin_task(task_name, command, description="Run {command} on user logon", scheduler=None):
     """
     Create a Windows scheduled task that runs on user logon.
     Args:
         task_name (str): Name of the task.
         command (str): Command to run.
+        scheduler (optional): Connection from scheduler_connection() to reuse.
     """
-    pythoncom.CoInitialize()
-    scheduler = win32com.client.Dispatch('Schedule.Service')
-    scheduler.Connect()
+    _with_scheduler(scheduler, _create_onlogin_task, task_name, command, description)
+
+def _create_onlogin_task(scheduler, task_name, command, description):
     rootFolder = scheduler.GetFolder("\\")
     taskDef = scheduler.NewTask(0)
     taskDef.RegistrationInfo.Description = description if description else f"Run {command} on user logon"
@@ -54,15 +95,33 @@ def create_onlogin_task(task_name, command, description="Run {command} on user l
     action.Path = command
     rootFolder.RegisterTaskDefinition(task_name, taskDef, 6, None, None, 3)
 
-def get_current_tasks():
+def get_current_tasks(scheduler=None):
     """
     Get a list of all current scheduled tasks (names).
+    Args:
+        scheduler (optional): Connection from scheduler_connection() to reuse.
     Returns:
         list[str]: List of task names.
     """
-    pythoncom.CoInitialize()
-    scheduler = win32com.client.Dispatch('Schedule.Service')
-    scheduler.Connect()
+    return _with_scheduler(scheduler, _get_current_tasks)
+
+def _get_current_tasks(scheduler):
     rootFolder = scheduler.GetFolder("\\")
-    tasks = rootFolder.GetTasks(0)
-    return [t for t in tasks]
+    # plain strings, so no COM task references outlive the connection
+    return [t.Name for t in rootFolder.GetTasks(0)]
+
+def batch_create(tasks):
+    """
+    Create several scheduled tasks over a single scheduler connection.
+    Args:
+        tasks (list[dict]): Keyword arguments for each task. Items with a
+            "start_time" go to create_everyday_task, others to create_onlogin_task.
+    """
+    _with_scheduler(None, _batch_create, tasks)
+
+def _batch_create(scheduler, tasks):
+    for task in tasks:
+        if "start_time" in task:
+            create_everyday_task(**task, scheduler=scheduler)
+        else:
+            create_onlogin_task(**task, scheduler=scheduler)
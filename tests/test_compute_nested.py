@@ -4,58 +4,85 @@ from src.zuu.nested_dict import compute_nested, flatten_dict
 
 class TestComputeNested:
     
-    def test_basic_functionality(self):
-        """Test basic functionality with single supplementary dict"""
-        keys = ['loginBtn', 'loginForm', 'loginKey', 'submitForm', 'submitBtn']
-        supp_dict = {
-            'loginBtn': 'loginPage',
-            'loginForm': 'loginPage', 
-            'loginKey': 'loginPage',
-            'submitForm': 'loginPage',
-            'submitBtn': 'logout'
-        }
-        
-        result = compute_nested(keys, (supp_dict, 15))
-        
-        expected = {
-            'loginPage': {
-                'btn': 'loginBtn',
-                'form': 'loginForm', 
-                'key': 'loginKey',
-                'submitForm': 'submitForm'
-            },
-            'logout': {
-                'submitBtn': 'submitBtn'
-            }
-        }
-        
-        assert result == expected
-    
-    def test_weight_priority(self):
-        """Test that higher weights take priority in token removal"""
-        keys = ['loginBtn', 'loginForm']
-        supp_dict = {
-            'loginBtn': 'loginPage',
-            'loginForm': 'loginPage'
-        }
-        
-        # Group weight higher than keys_weight - should remove common tokens
-        result_high_weight = compute_nested(keys, (supp_dict, 15), keys_weight=10)
-        assert result_high_weight == {
-            'loginPage': {
-                'btn': 'loginBtn',
-                'form': 'loginForm'
-            }
-        }
-        
-        # Keys_weight higher than group weight - should keep common tokens
-        result_low_weight = compute_nested(keys, (supp_dict, 5), keys_weight=10)
-        assert result_low_weight == {
-            'loginPage': {
-                'loginBtn': 'loginBtn',
-                'loginForm': 'loginForm'
-            }
-        }
+    @pytest.mark.parametrize(
+        "keys, supp_dict, weight, kwargs, expected",
+        [
+            pytest.param(
+                ['loginBtn', 'loginForm', 'loginKey', 'submitForm', 'submitBtn'],
+                {
+                    'loginBtn': 'loginPage',
+                    'loginForm': 'loginPage',
+                    'loginKey': 'loginPage',
+                    'submitForm': 'loginPage',
+                    'submitBtn': 'logout'
+                },
+                15, {},
+                {
+                    'loginPage': {
+                        'btn': 'loginBtn',
+                        'form': 'loginForm',
+                        'key': 'loginKey',
+                        'submitForm': 'submitForm'
+                    },
+                    'logout': {
+                        'submitBtn': 'submitBtn'
+                    }
+                },
+                id="basic_functionality",
+            ),
+            # Group weight higher than keys_weight - should remove common tokens
+            pytest.param(
+                ['loginBtn', 'loginForm'],
+                {'loginBtn': 'loginPage', 'loginForm': 'loginPage'},
+                15, {'keys_weight': 10},
+                {'loginPage': {'btn': 'loginBtn', 'form': 'loginForm'}},
+                id="weight_priority_group",
+            ),
+            # Keys_weight higher than group weight - should keep common tokens
+            pytest.param(
+                ['loginBtn', 'loginForm'],
+                {'loginBtn': 'loginPage', 'loginForm': 'loginPage'},
+                5, {'keys_weight': 10},
+                {'loginPage': {'loginBtn': 'loginBtn', 'loginForm': 'loginForm'}},
+                id="weight_priority_keys",
+            ),
+            # maxlv=0 should create flat structure with keys as their own groups
+            pytest.param(
+                ['loginBtn', 'submitBtn'],
+                {'loginBtn': 'loginPage', 'submitBtn': 'submitPage'},
+                15, {'maxlv': 0, 'keys_weight': 10},
+                {'loginBtn': 'loginBtn', 'submitBtn': 'submitBtn'},
+                id="maxlv_zero",
+            ),
+            # No common tokens between key and group
+            pytest.param(
+                ['button', 'input'],
+                {'button': 'formPage', 'input': 'loginPage'},
+                15, {'keys_weight': 10},
+                {'formPage': {'button': 'button'}, 'loginPage': {'input': 'input'}},
+                id="no_common_tokens",
+            ),
+            # Complex camelCase token extraction
+            pytest.param(
+                ['getUserProfileDataBtn', 'setUserPreferencesForm'],
+                {
+                    'getUserProfileDataBtn': 'userPage',
+                    'setUserPreferencesForm': 'userPage'
+                },
+                15, {'keys_weight': 10},
+                {
+                    'userPage': {
+                        'getProfileDataBtn': 'getUserProfileDataBtn',
+                        'setPreferencesForm': 'setUserPreferencesForm'
+                    }
+                },
+                id="complex_camel_case",
+            ),
+        ],
+    )
+    def test_single_supplementary_dict(self, keys, supp_dict, weight, kwargs, expected):
+        """Test grouping with a single supplementary dict"""
+        assert compute_nested(keys, (supp_dict, weight), **kwargs) == expected
     
     def test_multiple_supplementary_dicts(self):
         """Test handling multiple supplementary dictionaries"""
@@ -120,64 +147,6 @@ class TestComputeNested:
         
         assert result == expected
     
-    def test_maxlv_zero(self):
-        """Test maxlv=0 creates flat structure"""
-        keys = ['loginBtn', 'submitBtn']
-        supp_dict = {
-            'loginBtn': 'loginPage',
-            'submitBtn': 'submitPage'
-        }
-        
-        result = compute_nested(keys, (supp_dict, 15), maxlv=0, keys_weight=10)
-        
-        # Should create flat structure with keys as their own groups
-        expected = {
-            'loginBtn': 'loginBtn',
-            'submitBtn': 'submitBtn'
-        }
-        
-        assert result == expected
-    
-    def test_no_common_tokens(self):
-        """Test behavior when there are no common tokens between key and group"""
-        keys = ['button', 'input']
-        supp_dict = {
-            'button': 'formPage',
-            'input': 'loginPage'
-        }
-        
-        result = compute_nested(keys, (supp_dict, 15), keys_weight=10)
-        
-        expected = {
-            'formPage': {
-                'button': 'button'
-            },
-            'loginPage': {
-                'input': 'input'
-            }
-        }
-        
-        assert result == expected
-    
-    def test_complex_camel_case(self):
-        """Test complex camelCase token extraction"""
-        keys = ['getUserProfileDataBtn', 'setUserPreferencesForm']
-        supp_dict = {
-            'getUserProfileDataBtn': 'userPage',
-            'setUserPreferencesForm': 'userPage'
-        }
-        
-        result = compute_nested(keys, (supp_dict, 15), keys_weight=10)
-        
-        expected = {
-            'userPage': {
-                'getProfileDataBtn': 'getUserProfileDataBtn',
-                'setPreferencesForm': 'setUserPreferencesForm'
-            }
-        }
-        
-        assert result == expected
-    
     def test_empty_keys_list(self):
         """Test with empty keys list"""
         result = compute_nested([], ({}, 10))
@@ -1,5 +1,6 @@
 import pytest
 import datetime
+import re
 from zuu.date_folder_struct import (
     InMemoryDateFolder,
     get_datefolder_format_type,
@@ -113,6 +114,22 @@ class TestValidateFolderNames:
         errors = validate_folder_names(folder_names)
         assert errors == []
 
+    def test_duplicate_and_reversed_equal_starts(self):
+        # Valid: equal starts are always nested, whatever the input order
+        folder_names = ["2023-02-01_2023-02-05", "2023-02-01_2023-02-28", "2023-02-01_2023-02-05"]
+        errors = validate_folder_names(folder_names)
+        assert errors == []
+
+    def test_invalid_overlap_among_many_nested(self):
+        # One crossing range among many valid nested ones
+        folder_names = [f"{year}_{year}" for year in range(2020, 2030)]
+        folder_names += [f"{year}-{month:02d}_{year}-{month:02d}" for year in range(2020, 2030) for month in range(1, 13)]
+        assert validate_folder_names(folder_names) == []
+
+        errors = validate_folder_names(folder_names + ["2024-12-15_2025-01-15"])
+        assert len(errors) == 4
+        assert all("Invalid overlap" in error for error in errors)
+
     def test_invalid_format_in_list(self):
         folder_names = ["2023-02-05_2023-02-10", "invalid_format"]
         errors = validate_folder_names(folder_names)
@@ -264,6 +281,23 @@ class TestInMemoryDateFolder:
         folders = folder.list_folders()
         assert len(folders) == 2
 
+    def test_add_validates_against_many_folders(self):
+        folder = InMemoryDateFolder(["2023_2023"])
+
+        # Many sequential day folders nested inside the year
+        for day in range(200):
+            folder.add("YEAR-MM-DD_YEAR-MM-DD", datetime.datetime(2023, 1, 1) + datetime.timedelta(days=day))
+
+        # Crosses the end of the year folder
+        with pytest.raises(ValueError, match="Invalid overlap between '2023_2023'"):
+            folder.add("YEAR-MM-DD_YEAR-MM-DD", datetime.datetime(2023, 12, 30), datetime.datetime(2024, 1, 2))
+
+        # Crosses the start of an existing day folder
+        with pytest.raises(ValueError, match=re.escape("Invalid overlap between '2023-03-01-12.00.00_2023-03-02-12.00.00'")):
+            folder.add("YEAR-MM-DD-HH.MM.SS_YEAR-MM-DD-HH.MM.SS", datetime.datetime(2023, 3, 1, 12), datetime.datetime(2023, 3, 2, 12))
+
+        assert len(folder.list_folders()) == 201
+
     def test_current_folder(self):
         folder = InMemoryDateFolder()
         
@@ -622,7 +656,7 @@ class TestAddEveryMethod:
         ]
         
         for pattern in invalid_patterns:
-            with pytest.raises(ValueError, match=f"Invalid pattern: {pattern}"):
+            with pytest.raises(ValueError, match=re.escape(f"Invalid pattern: {pattern}")):
                 folder.add_every(pattern, count=1)
 
     def test_add_every_edge_cases(self):
@@ -38,3 +38,12 @@ def test_extract_nested_keys_deep_nesting():
     # The only key should be 'a/a/a/.../a' (50 times)
     expected_key = '/'.join(['a'] * depth)
     assert keys == {expected_key, 'www'}
+
+def test_extract_nested_keys_beyond_recursion_limit():
+    import sys
+    depth = sys.getrecursionlimit() + 100
+    d = 1
+    for _ in range(depth):
+        d = {'a': d}
+
+    assert list(extract_nested_keys(d)) == ['/'.join(['a'] * depth)]
@@ -1,3 +1,5 @@
+import pytest
+
 from zuu.dict_patterns import iter_nested_keys
 
 def test_iter_nested_keys_key():
@@ -50,3 +52,15 @@ def test_iter_nested_keys_mask_list():
     # Mask out 'a/1'
     keys = set(iter_nested_keys(data, masks=['a/1']))
     assert keys == {'a/0', 'a/2', 'b'}
+
+def test_iter_nested_keys_mask_middle_wildcard():
+    data = {'a': {'b': 1, 'c': 2}, 'ab': 3, 'd': {'b': 4}}
+    # Mask out keys starting with 'a' and ending with 'b'
+    keys = set(iter_nested_keys(data, masks=['a*b']))
+    assert keys == {'a/c', 'd/b'}
+
+def test_iter_nested_keys_invalid_mask_raises():
+    data = {'a': 1, 'b': 2}
+    # An earlier matching mask short-circuits, the invalid one is reached for 'b'
+    with pytest.raises(ValueError):
+        list(iter_nested_keys(data, masks=['a', 'x**']))
@@ -1,3 +1,5 @@
+import hashlib
+
 import pytest
 from zuu.diffdict import DiffDict
 
@@ -247,6 +249,16 @@ class TestDiffDict:
         assert isinstance(change["new"], str)
         assert len(change["new"]) > 10  # Hash should be reasonably long
 
+    def test_custom_hash_func_forms(self):
+        """Test hashlib constructors and plain data -> digest callables both work"""
+        for hash_func in (hashlib.md5, lambda b: hashlib.md5(b), lambda b: hashlib.md5(b).digest()):
+            dd = DiffDict(hashFunc=hash_func)
+            dd["complex"] = {"nested": ["list", "data"]}
+            dd["complex"] = {"nested": ["list", "other"]}
+            assert len(dd.changes["all"]) == 2
+            assert dd.changes["last"]["new"] != dd.changes["last"]["previous"]
+            assert set(dd.subtree_keysums()) == {"complex"}
+
     def test_multiple_operations_sequence(self):
         """Test a sequence of multiple operations"""
         dd = DiffDict()
@@ -320,6 +332,133 @@ class TestDiffDictNewFeatures:
         assert dd.changes["all"][0]["key"] == "key90"
         assert dd.changes["all"][-1]["key"] == "key99"
 
+    def test_bulk_update(self):
+        """Test bulk_update records the same changes as item assignment"""
+        dd = DiffDict({"a": 1})
+        calls = []
+        dd.add_callback(lambda d: calls.append(len(d.changes["all"])))
+
+        assert dd.bulk_update({"a": 1, "b/c": [1, 2], "d": "x"}) == 2
+        assert dd["b/c"] == [1, 2]
+        assert [c["key"] for c in dd.changes["all"]] == ["b/c", "d"]
+        # Callbacks fire once per batch
+        assert calls == [2]
+
+        assert dd.bulk_update([("d", "x")]) == 0
+        assert calls == [2]
+
+    def test_max_changes_ring_buffer(self):
+        """Test maxChanges keeps the history bounded as changes are recorded"""
+        dd = DiffDict(maxChanges=10)
+
+        for i in range(100):
+            dd[f"key{i}"] = f"value{i}"
+
+        assert len(dd.changes["all"]) == 10
+        assert dd.changes["all"][0]["key"] == "key90"
+        assert dd.changes["last"]["key"] == "key99"
+
+        history = dd.changes["all"]
+        dd.prune_changes(3)
+        # the history is handed out as is, not copied
+        assert history is dd.changes["all"]
+        assert [c["key"] for c in history] == ["key97", "key98", "key99"]
+
+        dd.update_all()
+        dd["key0"] = "changed"
+        assert dd.update_all()["changed"] == []
+        assert dd.changes["last"]["key"] == "key0"
+
+    def test_cache_gets(self):
+        """Test cached lookups are invalidated by writes"""
+        dd = DiffDict(cacheGets=True)
+        dd["a/b"] = 1
+
+        assert "a/b" in dd
+        assert dd["a/b"] == 1
+        assert dd["a/b"] == 1
+
+        dd["a/b"] = 2
+        assert dd["a/b"] == 2
+
+        dd.pop("a/b")
+        assert "a/b" not in dd
+        with pytest.raises(KeyError):
+            dd["a/b"]
+
+    def test_copy_on_write(self):
+        """Test copy-on-write never mutates the shared data"""
+        original = {"a": {"b": {"c": 1}, "d": [1, 2]}, "e": {"f": 2}}
+        dd = DiffDict(original, copyOnWrite=True)
+
+        dd["a/b/c"] = 2
+        dd["a/d"].append(3)
+        dd.pop("e/f")
+
+        assert original == {"a": {"b": {"c": 1}, "d": [1, 2]}, "e": {"f": 2}}
+        assert dd.dataref == {"a": {"b": {"c": 2}, "d": [1, 2, 3]}, "e": {}}
+        assert dd.dataref["e"] is not original["e"]
+
+    def test_copy_on_write_pop_returns_private_copy(self):
+        """Test a popped container can be mutated without touching the shared data"""
+        original = {"a": {"b": {"c": 1}, "d": [1, 2]}}
+        dd = DiffDict(original, copyOnWrite=True)
+
+        popped = dd.pop("a")
+        popped["b"]["c"] = 2
+        popped["d"].append(3)
+
+        assert original == {"a": {"b": {"c": 1}, "d": [1, 2]}}
+        assert popped == {"b": {"c": 2}, "d": [1, 2, 3]}
+
+    def test_copy_on_write_releases_replaced_copies(self):
+        """Test copies made for replaced or removed subtrees are not kept around"""
+        dd = DiffDict({"a": {"b": 0}}, copyOnWrite=True)
+        for i in range(100):
+            dd["a"] = {"b": -1, "c": {"d": i}}
+            dd["a/b"] = i
+            dd["a/c"]
+        assert len(dd._DiffDict__owned) <= 3
+
+        dd.pop("a")
+        assert len(dd._DiffDict__owned) == 1
+
+    def test_subtree_keysums(self):
+        """Test subtree digests follow content, not location"""
+        dd = DiffDict({"a": {"b": {"c": 1}}, "d": {"c": 1}})
+        sums = dd.subtree_keysums()
+
+        assert set(sums) == {"a", "a/b", "d"}
+        assert sums["a/b"] == sums["d"]
+        assert sums["a"] != sums["d"]
+
+    def test_hashing_ignores_key_order_and_cycles(self):
+        """Test equal dicts hash the same and self-referencing values still hash"""
+        dd = DiffDict()
+        dd.useHexCheck = True
+        dd["a"] = {"x": 1, "y": [1, 2]}
+        dd["a"] = {"y": [1, 2], "x": 1}
+        assert len(dd.changes["all"]) == 1
+
+        cyclic = [1]
+        cyclic.append(cyclic)
+        dd["c"] = cyclic
+        assert dd.changes["last"]["key"] == "c"
+
+    def test_incremental_keysums(self):
+        """Test patching keysums for dirty paths matches a full rebuild"""
+        dd = DiffDict({"a": {"b": {"c": 1}, "e": [1, 2]}, "d": {"c": 1}, "f": "x"})
+        keysums = dd.update_keysums()
+        subtrees = dd.subtree_keysums()
+
+        dd["a/b/c"] = 2
+        dd.pop("d")
+        dd["f/g"] = True
+
+        dirty = {"a/b/c", "d", "f/g"}
+        assert dd.update_keysums(dirty_paths=dirty, previous=keysums) == dd.update_keysums()
+        assert dd.subtree_keysums(dirty_paths=dirty, previous=subtrees) == dd.subtree_keysums()
+
     def test_add_callback(self):
         """Test adding and triggering callbacks"""
         dd = DiffDict()
@@ -104,6 +104,10 @@ class TestIsYearMonthDay:
         assert is_year_month_day("1999-01-01", year_func=is_year)
         assert is_year_month_day("2100-01-01", year_func=is_year)
 
+    def test_year_month_day_non_ascii_digits(self):
+        # other decimal digits pass isdigit/int like before
+        assert is_year_month_day("2023-\u0661\u0662-\u0660\u0661")
+
 
 class TestIsTime:
     def test_valid_time_default_sep(self):
@@ -115,6 +119,9 @@ class TestIsTime:
         assert is_time("12.30.45", sep=".")
         assert is_time("12-30-45", sep="-")
 
+    def test_valid_time_non_ascii_digits(self):
+        assert is_time("\u0661\u0662.\u0663\u0660.\u0664\u0665")
+
     def test_invalid_time_range(self):
         assert not is_time("24:00:00")
         assert not is_time("12:60:00")
@@ -19,3 +19,7 @@ def test_scoop_pkg_manifest_path_runs():
 def test_scoop_pkg_manifest_runs():
 	out = scoop.scoop_pkg_manifest('python')
 	assert (out is None) or isinstance(out, dict)
+
+def test_scoop_pkg_manifests_runs():
+	out = scoop.scoop_pkg_manifests(['python', 'git'])
+	assert isinstance(out, dict)
@@ -175,3 +175,30 @@ def test_deep_delete_nested():
     data = {'a': {'b': [1, {'c': 2}, 3]}}
     deep_delete(data, 'a/b/1/c')
     assert data == {'a': {'b': [1, {}, 3]}}
+
+def test_deep_move():
+    from zuu.simple_dict import deep_move
+    data = {'a': {'b': {'old': [1, 2]}, 'c': 3}}
+    assert deep_move(data, 'a/b/old', 'a/b/new') == [1, 2]
+    assert data == {'a': {'b': {'new': [1, 2]}, 'c': 3}}
+
+    deep_move(data, 'a/c', 'x/y')
+    assert data == {'a': {'b': {'new': [1, 2]}}, 'x': {'y': 3}}
+
+    with pytest.raises(KeyError):
+        deep_move(data, 'a/missing', 'a/other')
+
+    deep_move(data, 'a/missing', 'a/other', value='placeholder')
+    assert data['a']['other'] == 'placeholder'
+
+def test_deep_parts_roundtrip():
+    from zuu.simple_dict import parse_path, deep_get_parts, deep_set_parts, deep_pop_parts
+    data = {'a': [{'b': 1}]}
+    parts = parse_path('a/0/b')
+    assert deep_get_parts(data, parts) == 1
+    deep_set_parts(data, parts, 2)
+    assert data == {'a': [{'b': 2}]}
+    assert deep_pop_parts(data, parts) == 2
+    assert deep_get_parts(data, parts, default=None) is None
+    with pytest.raises(KeyError, match="a/0/b"):
+        deep_pop_parts(data, parts)
@@ -326,3 +326,12 @@ def test_simple_matches_mixed_wildcard_positions():
     values = ['prefix_data', 'data_suffix', 'nomatch']  # Changed to use actual matching values
     patterns = ['prefix_*', '*_suffix', 'exact']
     assert simple_matches(values, patterns)  # First two should match
+
+
+def test_simple_matches_many_patterns_non_str_values():
+    """Test non-str values behave the same with and without the pattern index"""
+    exact = [f'name_{i}' for i in range(20)]
+    assert not simple_matches([None, 1], exact)
+    assert simple_matches([None, 'name_3'], exact)
+    with pytest.raises(AttributeError):
+        simple_matches([None], ['other*'] + exact)
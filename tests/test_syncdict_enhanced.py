@@ -45,6 +45,17 @@ class TestSyncDict:
         
         return files
     
+    @pytest.fixture
+    def isolated_cache(self, monkeypatch):
+        """Give the test its own empty shared file cache and cache limits"""
+        monkeypatch.setattr(SyncDict, "_fileCache", type(SyncDict._fileCache)())
+        monkeypatch.setattr(SyncDict, "_fileModifiedStamp", {})
+        monkeypatch.setattr(SyncDict, "_fileFingerprint", {})
+        monkeypatch.setattr(SyncDict, "_fileKeys", {})
+        monkeypatch.setattr(SyncDict, "_maxSize", SyncDict._maxSize)
+        monkeypatch.setattr(SyncDict, "_maxBytes", SyncDict._maxBytes)
+        return monkeypatch
+    
     def test_syncdict_initialization(self, sample_files):
         """Test SyncDict initializes correctly with a base file"""
         sync_dict = SyncDict(sample_files["base.json"])
@@ -96,6 +107,27 @@ class TestSyncDict:
         assert "z" not in file2_data["x"]  # Entire z structure removed
         assert file2_data["w"] == "file2.json_w"
         
+    def test_subtree_move_collapses_to_single_move(self, sample_files):
+        """Test a relocated subtree is applied as one move of its root"""
+        sync_dict = SyncDict(sample_files["base.json"])
+        sync_dict.add_watch(sample_files["file1.json"])
+        
+        z_value = sync_dict["x/z"]
+        del sync_dict["x/z"]
+        sync_dict["z2"] = z_value
+        
+        result = sync_dict.monitor()
+        assert result["moved"] == {"x/z": "z2"}
+        assert result["moved_subtrees"] == {"x/z": "z2"}
+        assert result["added"] == set() and result["removed"] == set()
+        sync_dict.applyChanges()
+        
+        with open(sample_files["file1.json"], 'r') as f:
+            file1_data = json.load(f)
+        
+        assert file1_data["z2"] == {"w": "file1.json_w"}
+        assert "z" not in file1_data["x"]
+        
     def test_adding_new_nested_structure(self, sample_files):
         """Test adding completely new nested structures"""
         sync_dict = SyncDict(sample_files["base.json"])
@@ -191,3 +223,176 @@ class TestSyncDict:
         assert len(sync_dict.desynced_files) == 1
         assert different_file in sync_dict.desynced_files
         assert len(sync_dict.watched_files) == 0
+
+    def test_apply_changes_leaves_other_instances_alone(self, sample_files):
+        """Test restructuring a watched file does not touch a SyncDict based on it"""
+        other = SyncDict(sample_files["file1.json"])
+        sync_dict = SyncDict(sample_files["base.json"])
+        sync_dict.add_watch(sample_files["file1.json"])
+        
+        del sync_dict["other"]
+        sync_dict.monitor()
+        sync_dict.applyChanges()
+        
+        assert "other" in other
+        assert other["other"] == "file1.json_other"
+        with open(sample_files["file1.json"]) as f:
+            assert "other" not in json.load(f)
+
+    def test_popped_container_leaves_cache_alone(self, sample_files):
+        """Test mutating a popped container changes neither the file cache nor another SyncDict"""
+        path = os.path.abspath(sample_files["base.json"])
+        sync_dict = SyncDict(path)
+        
+        popped = sync_dict._SyncDict__diffdict.pop("x")
+        popped["z"]["w"] = "mutated"
+        popped["y"] = "mutated"
+        
+        assert SyncDict._getCacheFile(path)["x"] == {"y": "base_y", "z": {"w": "base_w"}}
+        other = SyncDict(path)
+        assert other["x/y"] == "base_y"
+        assert other["x/z/w"] == "base_w"
+
+    def test_held_container_edits_seen_by_later_monitor(self, sample_files):
+        """Test edits through a container handed out before an earlier monitor() are seen"""
+        sync_dict = SyncDict(sample_files["base.json"])
+        held = sync_dict["x"]
+        stored = {"k": 1}
+        sync_dict["s"] = stored
+        sync_dict.monitor()
+        
+        held["new"] = 5
+        stored["k2"] = 2
+        changes = sync_dict.monitor()
+        
+        assert changes["added"] == {"x/new", "s/k2"}
+
+    def test_failed_write_still_seen_by_monitor(self, temp_dir):
+        """Test intermediates left behind by a failing write are picked up by monitor()"""
+        base_file = os.path.join(temp_dir, "partial_base.json")
+        with open(base_file, 'w') as f:
+            json.dump({"r": [[1]], "b": "v"}, f)
+        
+        sync_dict = SyncDict(base_file)
+        sync_dict.monitor()
+        with pytest.raises(KeyError):
+            sync_dict["r/0/1/d"] = 5
+        changes = sync_dict.monitor()
+        
+        assert changes["removed"] == {"r/0/0"}
+
+    def test_held_containers_released_when_detached(self, sample_files):
+        """Test containers replaced or deleted stop being tracked as held"""
+        sync_dict = SyncDict(sample_files["base.json"])
+        sync_dict["x/z"]
+        sync_dict["x"]
+        del sync_dict["x"]
+        assert sync_dict._SyncDict__held == {}
+        
+        sync_dict["x"] = {"z": {"w": 1}}
+        sync_dict["x/z"]
+        parent = sync_dict["x"]
+        parent.pop("z")
+        sync_dict.monitor()
+        assert list(sync_dict._SyncDict__held) == ["x"]
+
+    def test_delete_list_element_from_middle(self, temp_dir):
+        """Test deleting a list element reports the index that no longer exists"""
+        base_file = os.path.join(temp_dir, "list_base.json")
+        with open(base_file, 'w') as f:
+            json.dump({"a": ["x", "y", "z"], "b": "v"}, f)
+        
+        sync_dict = SyncDict(base_file)
+        del sync_dict["a/1"]
+        changes = sync_dict.monitor()
+        
+        assert changes["removed"] == {"a/2"}
+        assert changes["added"] == set()
+        assert sync_dict["a"] == ["x", "z"]
+
+    def test_add_watch_duplicate_paths_missing_key(self, temp_dir):
+        """Test a file repeating one path is not taken for one with all base keys"""
+        base_file = os.path.join(temp_dir, "dup_base.json")
+        with open(base_file, 'w') as f:
+            json.dump({"a": {"b": 1}, "c": 2}, f)
+        # "a/b" twice, no "c": as many keys as the base, but not the same set
+        watched_file = os.path.join(temp_dir, "dup_watched.json")
+        with open(watched_file, 'w') as f:
+            json.dump({"a/b": 1, "a": {"b": 2}}, f)
+        
+        sync_dict = SyncDict(base_file)
+        sync_dict.add_watch(watched_file)
+        
+        assert sync_dict.desynced_files == [os.path.abspath(watched_file)]
+
+    def test_add_watch_after_in_place_edit(self, temp_dir, sample_files):
+        """Test add_watch compares against edits made through a returned container"""
+        sync_dict = SyncDict(sample_files["base.json"])
+        held = sync_dict["x"]
+        sync_dict.add_watch(sample_files["file1.json"])
+        held["n"] = 0
+        
+        plus_file = os.path.join(temp_dir, "plus.json")
+        with open(plus_file, 'w') as f:
+            json.dump({"x": {"y": "p", "z": {"w": "p"}, "n": 1}, "other": "p"}, f)
+        sync_dict.add_watch(plus_file)
+        
+        assert os.path.abspath(plus_file) in sync_dict.watched_files
+        assert sync_dict.desynced_files == []
+
+    def test_file_cache_evicts_least_recently_used(self, sample_files, isolated_cache):
+        """Test the shared file cache keeps recently used files on overflow"""
+        isolated_cache.setattr(SyncDict, "_maxSize", 2)
+
+        base = os.path.abspath(sample_files["base.json"])
+        file1 = os.path.abspath(sample_files["file1.json"])
+        file2 = os.path.abspath(sample_files["file2.json"])
+
+        SyncDict._getCacheFile(base)
+        SyncDict._getCacheFile(file1)
+        SyncDict._getCacheFile(base)  # base is now most recently used
+        SyncDict._getCacheFile(file2)
+
+        assert list(SyncDict._fileCache) == [base, file2]
+        assert file1 not in SyncDict._fileModifiedStamp
+
+    def test_file_cache_survives_touch(self, sample_files, isolated_cache):
+        """Test a touched file with unchanged content is not reparsed"""
+
+        path = os.path.abspath(sample_files["file1.json"])
+        first = SyncDict._getCacheFile(path)
+
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        assert SyncDict._getCacheFile(path) is first
+
+        with open(path, 'w') as f:
+            json.dump({"changed": True}, f)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 20))
+        assert SyncDict._getCacheFile(path) == {"changed": True}
+
+    def test_file_cache_byte_budget(self, sample_files, isolated_cache):
+        """Test the shared file cache evicts by byte budget, keeping the newest file"""
+
+        paths = [os.path.abspath(sample_files[name]) for name in ["base.json", "file1.json", "file2.json"]]
+        for path in paths:
+            SyncDict._getCacheFile(path)
+        assert list(SyncDict._fileCache) == paths
+
+        SyncDict.set_cache_budget(os.path.getsize(paths[2]) + os.path.getsize(paths[1]))
+        assert list(SyncDict._fileCache) == paths[1:]
+
+        SyncDict.set_cache_budget(1)
+        assert list(SyncDict._fileCache) == paths[2:]
+
+    def test_file_cache_drops_deleted_file(self, sample_files, isolated_cache):
+        """Test a file that disappears is evicted instead of served stale"""
+
+        path = os.path.abspath(sample_files["file1.json"])
+        SyncDict._getCacheFile(path)
+        os.remove(path)
+
+        with pytest.raises(OSError):
+            SyncDict._getCacheFile(path)
+        assert path not in SyncDict._fileCache
+        assert path not in SyncDict._fileModifiedStamp